@@ -2,6 +2,7 @@
 Configuration settings for the Retail Shelf Assistant.
 """
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
@@ -97,8 +98,9 @@ PERFORMANCE_CONFIG = {
     "batch_size": 1
 }
 
+@lru_cache(maxsize=1)
 def get_config() -> Dict[str, Any]:
-    """Get complete configuration dictionary."""
+    """Get complete configuration dictionary (built once and shared; do not mutate)."""
     return {
         "audio": AUDIO_CONFIG,
         "database": DATABASE_CONFIG,
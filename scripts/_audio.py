@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Shared audio service instances for the test scripts.
+Each service is created once per process so microphone and client setup is not repeated per probe.
+"""
+import atexit
+import functools
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+@functools.lru_cache(maxsize=1)
+def audio_service():
+    """Return the shared AudioIOService instance."""
+    from src.services.audio_io import AudioIOService
+    return AudioIOService()
+
+@functools.lru_cache(maxsize=1)
+def google_audio_service():
+    """Return the shared GoogleAudioIOService instance."""
+    from src.services.google_audio_io import GoogleAudioIOService
+    return GoogleAudioIOService()
+
+@functools.lru_cache(maxsize=4)
+def health_status(factory, generation: int = 0) -> dict:
+    """Health of the service built by factory; pass a new generation to re-probe."""
+    return factory().get_health_status()
+
+def release():
+    """Clean up any services created so far and drop them from the cache."""
+    for factory in (audio_service, google_audio_service):
+        if factory.cache_info().currsize:
+            factory().cleanup()
+        factory.cache_clear()
+    health_status.cache_clear()
+
+atexit.register(release)
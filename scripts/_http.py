@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session and probe payloads for the test scripts.
+Keeps connections to the local API alive across calls instead of opening a new one per request.
+"""
+import atexit
+import functools
+import io
+import json
+import wave
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from requests_toolbelt import MultipartEncoder
+    TOOLBELT_AVAILABLE = True
+except ImportError:
+    TOOLBELT_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def create_session(pool_maxsize: int = 20, retries: int = 2) -> requests.Session:
+    """Create a session whose connection pool keeps up to pool_maxsize connections alive.
+    
+    Dropped connections and 502/503/504 responses are retried up to retries
+    times with a short backoff. Only idempotent methods are retried, so POSTs
+    that record analytics are never sent twice; pass retries=0 for timed probes.
+    """
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.1, status_forcelist=(502, 503, 504),
+                  raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def post_multipart(session: requests.Session, url: str, fields: dict, **kwargs) -> requests.Response:
+    """POST a multipart form; (filename, content, mime) tuples are sent as file parts.
+
+    With requests_toolbelt installed the body is streamed to the socket instead
+    of being assembled in memory first.
+    """
+    if TOOLBELT_AVAILABLE:
+        encoder = MultipartEncoder(fields=fields)
+        return session.post(url, data=encoder, headers={'Content-Type': encoder.content_type}, **kwargs)
+    files = {name: value for name, value in fields.items() if isinstance(value, tuple)}
+    data = {name: value for name, value in fields.items() if not isinstance(value, tuple)}
+    return session.post(url, files=files, data=data, **kwargs)
+
+# JSON decoder for raw bytes, e.g. individual lines of a streamed response
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+def json_body(response: requests.Response):
+    """Decode a JSON response body, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+@functools.lru_cache(maxsize=1)
+def wav_probe() -> bytes:
+    """0.1 s of silent 16 kHz mono PCM16 WAV, built once."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(b'\x00' * 3200)
+    return buffer.getvalue()
+
+@functools.lru_cache(maxsize=1)
+def jpeg_probe() -> bytes:
+    """A 1x1 white JPEG, built once; placeholder bytes if Pillow is missing."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return b"fake image data for testing"
+    buffer = io.BytesIO()
+    Image.new('RGB', (1, 1), color='white').save(buffer, format='JPEG')
+    return buffer.getvalue()
+
+# Module-level session shared by every script that imports it
+SESSION = create_session()
+atexit.register(SESSION.close)
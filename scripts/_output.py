@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Shared stdout capture for the validation scripts.
+Lets checks run on worker threads while their output is still printed one check at a time.
+"""
+import io
+import threading
+
+class ThreadOutput:
+    """Stdout proxy that lets each worker thread collect its own output."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, "buffer", None)
+        return (self.stream if buffer is None else buffer).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def capture(self, func):
+        """Run func, returning its result and everything it printed."""
+        self.local.buffer = io.StringIO()
+        try:
+            return func(), self.local.buffer.getvalue()
+        finally:
+            self.local.buffer = None
@@ -11,7 +11,8 @@ from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 def test_api_connection(base_url: str = "http://localhost:8000") -> bool:
     """Test if the API is running and accessible."""
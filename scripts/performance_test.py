@@ -19,6 +19,12 @@ import concurrent.futures
 from datetime import datetime
 import threading
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 @dataclass
 class PerformanceMetrics:
     """Container for performance metrics."""
@@ -35,10 +41,19 @@ class PerformanceMetrics:
 class PerformanceTestSuite:
     """Comprehensive performance testing suite."""
     
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = "http://localhost:8000", max_connections: int = 10):
         self.base_url = base_url
         self.results: List[PerformanceMetrics] = []
         self.lock = threading.Lock()
+        # Response times in result order, preallocated per run as contiguous float64
+        self._times = np.empty(0, dtype=np.float64)
+        self._time_count = 0
+        # Shared keep-alive connection pool, so warmed-up connections are reused.
+        # Size it to the worker count so concurrent runs never discard connections.
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         
         # Test queries for different types
         self.text_queries = [
@@ -130,7 +145,7 @@ class PerformanceTestSuite:
         
         start_time = time.time()
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/v1/ask",
                 json=payload,
                 timeout=30
@@ -214,7 +229,7 @@ class PerformanceTestSuite:
                 'return_audio': 'false'
             }
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/v1/ask-voice",
                 files=files,
                 data=data,
@@ -334,7 +349,7 @@ class PerformanceTestSuite:
                     'session_id': session_id or f"perf_test_{int(time.time())}"
                 }
                 
-                response = requests.post(
+                response = self.session.post(
                     f"{self.base_url}/api/v1/vision",
                     files=files,
                     data=data,
@@ -408,7 +423,7 @@ class PerformanceTestSuite:
         try:
             start_time = time.time()
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/health",
                 timeout=5
             )
@@ -446,6 +461,46 @@ class PerformanceTestSuite:
                 payload_size_bytes=0
             )
     
+    def _warmup(self, modes: List[str], n: int = 3) -> None:
+        """Send n untimed requests per endpoint so measurement starts on warm connections."""
+        print(f"Warming up {', '.join(modes)} endpoints ({n} requests each)...")
+        image_file = None
+        if "vision" in modes:
+            with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as temp_image:
+                image_file = self.create_test_image(temp_image.name)
+        
+        try:
+            for _ in range(n):
+                try:
+                    self.session.get(f"{self.base_url}/health", timeout=5)
+                    if "text" in modes:
+                        self.session.post(
+                            f"{self.base_url}/api/v1/ask",
+                            json={"query": self.text_queries[0], "session_id": "perf_warmup"},
+                            timeout=30
+                        )
+                    if "voice" in modes:
+                        self.session.post(
+                            f"{self.base_url}/api/v1/ask-voice",
+                            files={'audio_file': ('test.wav', b"test", 'audio/wav')},
+                            data={'session_id': "perf_warmup", 'return_audio': 'false'},
+                            timeout=10
+                        )
+                    if image_file:
+                        with open(image_file, 'rb') as f:
+                            self.session.post(
+                                f"{self.base_url}/api/v1/vision",
+                                files={'image_file': ('test_image.jpg', f, 'image/jpeg')},
+                                data={'session_id': "perf_warmup"},
+                                timeout=60
+                            )
+                except requests.exceptions.RequestException:
+                    # Warmup is best-effort; the timed run reports real failures
+                    pass
+        finally:
+            if image_file:
+                Path(image_file).unlink(missing_ok=True)
+    
     def run_single_test(self, mode: str, query: str, session_id: str) -> None:
         """Run a single test and store results."""
         if mode == "text":
@@ -461,7 +516,11 @@ class PerformanceTestSuite:
         
         with self.lock:
             self.results.append(result)
-            self.results.append(result)
+            if self._time_count == len(self._times):
+                # Called outside run_performance_tests, or more tests than slots: grow
+                self._times = np.resize(self._times, max(8, 2 * len(self._times)))
+            self._times[self._time_count] = result.response_time_ms
+            self._time_count += 1
         
         print(f"[{mode.upper()}] {query[:30]}... -> {result.response_time_ms:.1f}ms (Success: {result.success})")
     
@@ -470,7 +529,8 @@ class PerformanceTestSuite:
                             voice_count: int = 3, 
                             vision_count: int = 3,
                             concurrent: bool = False,
-                            max_workers: int = 3) -> Dict[str, Any]:
+                            max_workers: int = 3,
+                            warmup: int = 3) -> Dict[str, Any]:
         """Run comprehensive performance tests."""
         print("="*60)
         print("GROCERY ASSISTANT PERFORMANCE TEST SUITE")
@@ -494,10 +554,20 @@ class PerformanceTestSuite:
             query = f"Product image {i+1}"
             test_cases.append(("vision", query, f"{test_session}_vision_{i}"))
         
+        # One slot per test case, keeping any samples from earlier runs
+        previous = self._response_times()
+        self._times = np.empty(len(previous) + len(test_cases), dtype=np.float64)
+        self._times[:len(previous)] = previous
+        self._time_count = len(previous)
+        
         print(f"Running {len(test_cases)} tests...")
         print(f"Concurrent: {concurrent}, Max Workers: {max_workers if concurrent else 1}")
         print()
         
+        if warmup > 0 and test_cases:
+            self._warmup(sorted({mode for mode, _, _ in test_cases}), warmup)
+            print()
+        
         start_time = time.time()
         
         if concurrent:
@@ -518,11 +588,22 @@ class PerformanceTestSuite:
         
         return self.analyze_results(total_time)
     
+    def _response_times(self) -> np.ndarray:
+        """Response times aligned with self.results."""
+        if self._time_count == len(self.results):
+            return self._times[:self._time_count]
+        # Results were added without run_single_test; rebuild from them
+        return np.fromiter((r.response_time_ms for r in self.results), dtype=np.float64, count=len(self.results))
+    
     def analyze_results(self, total_time: float) -> Dict[str, Any]:
         """Analyze performance test results."""
         if not self.results:
             return {"error": "No test results available"}
         
+        all_times = self._response_times()
+        modes = np.array([r.mode for r in self.results])
+        succeeded = np.fromiter((r.success for r in self.results), dtype=bool, count=len(self.results))
+        
         # Group results by mode
         results_by_mode = {}
         for result in self.results:
@@ -542,7 +623,7 @@ class PerformanceTestSuite:
         }
         
         for mode, mode_results in results_by_mode.items():
-            response_times = [r.response_time_ms for r in mode_results if r.success]
+            times = all_times[(modes == mode) & succeeded]
             successful = [r for r in mode_results if r.success]
             failed = [r for r in mode_results if not r.success]
             
@@ -555,13 +636,17 @@ class PerformanceTestSuite:
                 "performance": {}
             }
             
-            if response_times:
+            if times.size:
+                # np.percentile selects quantiles by partitioning, without a full sort
+                p50, p95, p99 = np.percentile(times, [50, 95, 99])
                 mode_analysis["performance"] = {
-                    "avg_response_time_ms": statistics.mean(response_times),
-                    "min_response_time_ms": min(response_times),
-                    "max_response_time_ms": max(response_times),
-                    "median_response_time_ms": statistics.median(response_times),
-                    "std_dev_ms": statistics.stdev(response_times) if len(response_times) > 1 else 0
+                    "avg_response_time_ms": float(times.mean()),
+                    "min_response_time_ms": float(times.min()),
+                    "max_response_time_ms": float(times.max()),
+                    "median_response_time_ms": float(p50),
+                    "p95_response_time_ms": float(p95),
+                    "p99_response_time_ms": float(p99),
+                    "std_dev_ms": float(times.std(ddof=1)) if len(times) > 1 else 0
                 }
             
             # Confidence scores for successful tests
@@ -610,6 +695,8 @@ class PerformanceTestSuite:
                 print(f"     Min: {perf['min_response_time_ms']:.1f}ms")
                 print(f"     Max: {perf['max_response_time_ms']:.1f}ms")
                 print(f"     Median: {perf['median_response_time_ms']:.1f}ms")
+                print(f"     P95: {perf['p95_response_time_ms']:.1f}ms")
+                print(f"     P99: {perf['p99_response_time_ms']:.1f}ms")
                 print(f"     Std Dev: {perf['std_dev_ms']:.1f}ms")
             
             if "avg_confidence" in data:
@@ -637,12 +724,8 @@ class PerformanceTestSuite:
             if data["success_rate"] < 90:
                 print(f"   {mode.upper()} mode has low success rate ({data['success_rate']:.1f}%) - needs investigation")
     
-    def save_results_to_file(self, analysis: Dict[str, Any], filename: str = None) -> str:
-        """Save results to a JSON file."""
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"performance_test_results_{timestamp}.json"
-        
+    def serialize_results(self, analysis: Dict[str, Any]) -> bytes:
+        """Serialize the analysis and per-request results to indented JSON bytes."""
         # Prepare data for JSON serialization
         export_data = {
             "analysis": analysis,
@@ -663,8 +746,18 @@ class PerformanceTestSuite:
             "timestamp": datetime.now().isoformat()
         }
         
-        with open(filename, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            # orjson encodes straight to bytes and handles numpy values natively
+            return orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(export_data, indent=2).encode()
+    
+    def save_results_to_file(self, analysis: Dict[str, Any], filename: str = None) -> str:
+        """Save results to a JSON file."""
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"performance_test_results_{timestamp}.json"
+        
+        Path(filename).write_bytes(self.serialize_results(analysis))
         
         print(f"\n💾 Results saved to: {filename}")
         return filename
@@ -689,6 +782,8 @@ def main():
     parser.add_argument("--save-results", action="store_true", help="Save results to JSON file")
     parser.add_argument("--quick", action="store_true", help="Run quick test (1 test per mode)")
     parser.add_argument("--export", help="Export results to JSON file")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed warmup requests per endpoint")
+    parser.add_argument("--no-warmup", action="store_true", help="Skip warmup to measure cold-start latency")
     
     args = parser.parse_args()
     
@@ -716,11 +811,11 @@ def main():
         args.vision_tests = 1
     
     # Initialize test suite
-    test_suite = PerformanceTestSuite(args.url)
+    test_suite = PerformanceTestSuite(args.url, max_connections=max(args.max_workers, 1))
     
     # Check if server is running
     try:
-        response = requests.get(f"{args.url}/health", timeout=5)
+        response = test_suite.session.get(f"{args.url}/health", timeout=5)
         if response.status_code != 200:
             print(f"❌ Server health check failed: {response.status_code}")
             return
@@ -737,17 +832,17 @@ def main():
         voice_count=args.voice_tests,
         vision_count=args.vision_tests,
         concurrent=args.concurrent,
-        max_workers=args.max_workers
+        max_workers=args.max_workers,
+        warmup=0 if args.no_warmup else args.warmup
     )
     
     # Print detailed report
     test_suite.print_detailed_report(analysis)
     
     # Save results if requested
-    if args.save_results or args.export:
-        filename = args.export if args.export else f"performance_results_{int(time.time())}.json"
-        test_suite.export_results(analysis, filename)
-        print(f"📁 Results exported to {filename}")
+    if args.export:
+        test_suite.export_results(analysis, args.export)
+    elif args.save_results:
         test_suite.save_results_to_file(analysis)
     
     print(f"\n🎉 Performance testing complete!")
@@ -28,12 +28,19 @@ if __name__ == "__main__":
         if os.environ.get('ELECTRON_APP') == '1':
             use_reload = False
 
+        # Every worker loads its own copy of the speech/vision models, so
+        # extra workers are opt-in; the reloader only supports a single one.
+        workers = 1 if use_reload else max(1, int(os.environ.get('SERVER_WORKERS', '1')))
+
         uvicorn.run(
             "src.api.main:app",
             host="127.0.0.1",
             port=port,
             reload=use_reload,
-            log_level="info"
+            workers=workers,
+            log_level="info",
+            # Per-request access lines are only useful while developing
+            access_log=use_reload
         )
     except KeyboardInterrupt:
         print("\nServer stopped.")
@@ -2,10 +2,16 @@
 """
 Test script to generate analytics data by making API calls.
 """
-import requests
+import asyncio
 import json
-import time
 import random
+import time
+
+# Shared helper next to this script, whether run directly or imported as scripts.*
+if __package__:
+    from ._http import SESSION, json_body
+else:
+    from _http import SESSION, json_body
 
 # Test queries to generate analytics data
 test_queries = [
@@ -26,39 +32,74 @@ test_queries = [
     "What's the best way to cook chicken?"
 ]
 
-def test_api_calls():
-    """Make test API calls to generate analytics data."""
-    base_url = "http://localhost:8000/api/v1"
+class RateLimiter:
+    """Admit at most ``rate`` requests per second without blocking in-flight ones."""
     
-    print("Starting analytics test...")
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.next_slot = 0.0
+        self.lock = asyncio.Lock()
     
-    for i, query in enumerate(test_queries):
-        try:
-            # Make API call
-            response = requests.post(
+    async def __aenter__(self):
+        async with self.lock:
+            now = time.monotonic()
+            wait = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    async def __aexit__(self, *exc):
+        return False
+
+async def fire(session, semaphore, limiter, base_url, i, query, session_id):
+    """Send one analytics query and report its outcome."""
+    try:
+        async with limiter, semaphore:
+            # requests is blocking, so each call runs on a worker thread
+            response = await asyncio.to_thread(
+                session.post,
                 f"{base_url}/ask",
-                json={"query": query, "session_id": f"test_session_{random.randint(1, 5)}"},
+                json={"query": query, "session_id": session_id},
                 timeout=10
             )
-            
-            if response.status_code == 200:
-                print(f"✓ Query {i+1}: {query}")
-                result = response.json()
-                if "matches" in result:
-                    print(f"  Found {len(result['matches'])} matches")
-                elif "answer" in result:
-                    print(f"  Info response: {result['answer'][:50]}...")
-            else:
-                print(f"✗ Query {i+1} failed: {response.status_code}")
-            
-            # Small delay between requests
-            time.sleep(0.5)
-            
-        except Exception as e:
-            print(f"✗ Error with query {i+1}: {e}")
+        
+        if response.status_code == 200:
+            print(f"✓ Query {i+1}: {query}")
+            result = json_body(response)
+            if "matches" in result:
+                print(f"  Found {len(result['matches'])} matches")
+            elif "answer" in result:
+                print(f"  Info response: {result['answer'][:50]}...")
+        else:
+            print(f"✗ Query {i+1} failed: {response.status_code}")
+        
+    except Exception as e:
+        print(f"✗ Error with query {i+1}: {e}")
+
+async def test_api_calls():
+    """Make test API calls to generate analytics data."""
+    base_url = "http://localhost:8000/api/v1"
+    
+    print("Starting analytics test...")
+    
+    # Warm up the server and the session's connection pool with a health
+    # check, so cold-start cost is not charged to the first query. A query is
+    # not used for this because it would be recorded in the analytics.
+    try:
+        await asyncio.to_thread(SESSION.get, f"{base_url.removesuffix('/api/v1')}/health", timeout=5)
+    except Exception as e:
+        print(f"Warm-up health check failed: {e}")
+    
+    # Dispatch all queries at once: new requests start at 2/s, at most five
+    # in flight, and responses overlap instead of waiting on each other
+    semaphore = asyncio.Semaphore(5)
+    limiter = RateLimiter(rate=2)
+    session_ids = [f"test_session_{n}" for n in random.choices(range(1, 6), k=len(test_queries))]
+    await asyncio.gather(*[fire(SESSION, semaphore, limiter, base_url, i, query, session_ids[i])
+                           for i, query in enumerate(test_queries)])
     
     print(f"\nCompleted {len(test_queries)} test queries!")
     print("Analytics data should now be available at: http://localhost:8000/analytics")
 
 if __name__ == "__main__":
-    test_api_calls()
\ No newline at end of file
+    asyncio.run(test_api_calls())
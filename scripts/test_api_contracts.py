@@ -62,6 +62,8 @@ def test_config():
     try:
         from config.settings import get_config
         
+        # Measure a fresh load; later callers reuse the cached config
+        get_config.cache_clear()
         config = get_config()
         required_keys = ['audio', 'database', 'llm', 'classification', 'api', 'logging', 'performance']
         
@@ -81,15 +83,15 @@ def test_fastapi_app():
         from src.api.main import app
         
         # Check that the app has the expected routes
-        routes = [route.path for route in app.routes]
+        routes = frozenset(route.path for route in app.routes)
         expected_routes = ['/', '/health', '/api/v1/ask', '/api/v1/ask-voice']
         
-        for expected_route in expected_routes:
-            if expected_route not in routes:
-                print(f"Warning: Route {expected_route} not found in {routes}")
+        missing = [route for route in expected_routes if route not in routes]
+        if missing:
+            print(f"Warning: Routes {missing} not found in {sorted(routes)}")
         
         print("+ FastAPI app created successfully")
-        print(f"  Available routes: {routes}")
+        print(f"  Available routes: {sorted(routes)}")
         return True
     except Exception as e:
         print(f"- FastAPI app test failed: {e}")
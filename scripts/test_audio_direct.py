@@ -8,13 +8,19 @@ import sys
 import os
 import logging
 import time
+from logging.handlers import MemoryHandler
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
-from src.services.audio_io import AudioIOService
+# Shared helper next to this script, whether run directly or imported as scripts.*
+if __package__:
+    from ._audio import audio_service, health_status, release
+else:
+    from _audio import audio_service, health_status, release
 
 # Configure logging
 logging.basicConfig(
@@ -23,106 +29,127 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Progress messages are buffered and written in batches; the buffer is
+# flushed whenever the user has to act, and errors flush it immediately
+console = logging.getLogger(f"{__name__}.console")
+console.setLevel(logging.INFO)
+console.propagate = False
+console_handler = MemoryHandler(capacity=1024, flushLevel=logging.ERROR,
+                                target=logging.StreamHandler(sys.stdout))
+console.addHandler(console_handler)
+
 def test_audio_io():
     """Test the audio I/O service directly."""
-    print("🎤 Testing Audio I/O Service")
-    print("=" * 50)
+    import numpy as np
+    
+    console.info("🎤 Testing Audio I/O Service")
+    console.info("=" * 50)
     
     try:
         # Initialize audio service
-        print("1. Initializing Audio I/O Service...")
-        audio_service = AudioIOService()
+        console.info("1. Initializing Audio I/O Service...")
+        svc = audio_service()
         
         # Check health
-        print("2. Checking service health...")
-        health = audio_service.get_health_status()
-        print(f"   Health Status: {health}")
+        console.info("2. Checking service health...")
+        health = health_status(audio_service)
+        console.info(f"   Health Status: {health}")
         
         if not health.get('overall') == 'healthy':
-            print("❌ Audio service is not healthy!")
+            console.error("❌ Audio service is not healthy!")
             return False
         
-        print("✅ Audio service is healthy!")
+        console.info("✅ Audio service is healthy!")
         
         # Test recording
-        print("\n3. Testing microphone recording...")
-        print("   Speak clearly into your microphone for 3 seconds...")
-        print("   Recording starts in 3 seconds...")
+        console.info("\n3. Testing microphone recording...")
+        console.info("   Speak clearly into your microphone for 3 seconds...")
+        console.info("   Recording starts in 3 seconds...")
         
         for i in range(3, 0, -1):
-            print(f"   {i}...")
+            console.info(f"   {i}...")
+            console_handler.flush()
             time.sleep(1)
         
-        print("   🎤 RECORDING NOW - SPEAK CLEARLY!")
+        console.info("   🎤 RECORDING NOW - SPEAK CLEARLY!")
+        console_handler.flush()
         
         # Record audio
-        audio_data = audio_service.record(duration=3.0)
+        buf = np.empty(16000 * 3, dtype=np.float32)
+        audio_data = svc.record(duration=3.0, out=buf)
         
         if audio_data is None or len(audio_data) == 0:
-            print("❌ No audio data recorded!")
+            console.error("❌ No audio data recorded!")
             return False
         
-        print(f"✅ Recorded {len(audio_data)} samples")
-        print(f"   Audio shape: {audio_data.shape}")
-        print(f"   Audio range: {audio_data.min():.4f} to {audio_data.max():.4f}")
-        print(f"   Non-zero samples: {len(audio_data[audio_data != 0])}")
+        console.info(f"✅ Recorded {len(audio_data)} samples")
+        console.info(f"   Audio shape: {audio_data.shape}")
+        console.info(f"   Audio range: {audio_data.min():.4f} to {audio_data.max():.4f}")
+        console.info(f"   Non-zero samples: {np.count_nonzero(audio_data)}")
         
         # Test transcription
-        print("\n4. Testing speech-to-text transcription...")
-        print("   Transcribing your speech...")
+        console.info("\n4. Testing speech-to-text transcription...")
+        console.info("   Transcribing your speech...")
         
-        transcribed_text = audio_service.transcribe(audio_data)
+        start = time.perf_counter_ns()
+        transcribed_text = svc.transcribe(audio_data)
+        transcribe_ms = (time.perf_counter_ns() - start) / 1e6
         
         if not transcribed_text or not transcribed_text.strip():
-            print("❌ No speech detected in audio!")
-            print("   This could mean:")
-            print("   - Microphone is not working")
-            print("   - Audio was too quiet")
-            print("   - No speech was detected")
+            console.error("❌ No speech detected in audio!")
+            console.info("   This could mean:")
+            console.info("   - Microphone is not working")
+            console.info("   - Audio was too quiet")
+            console.info("   - No speech was detected")
             return False
         
-        print(f"✅ Transcription successful!")
-        print(f"   Transcribed text: '{transcribed_text}'")
+        console.info(f"✅ Transcription successful!")
+        console.info(f"   Transcribed text: '{transcribed_text}'")
+        console.info(f"   Transcription time: {transcribe_ms:.1f}ms")
         
         # Test TTS
-        print("\n5. Testing text-to-speech synthesis...")
+        console.info("\n5. Testing text-to-speech synthesis...")
         test_text = "Hello, this is a test of the text to speech system."
-        print(f"   Synthesizing: '{test_text}'")
+        console.info(f"   Synthesizing: '{test_text}'")
         
-        tts_audio = audio_service.synthesize(test_text)
+        start = time.perf_counter_ns()
+        tts_audio = svc.synthesize(test_text)
+        synthesize_ms = (time.perf_counter_ns() - start) / 1e6
         
         if tts_audio is None or len(tts_audio) == 0:
-            print("❌ TTS synthesis failed!")
+            console.error("❌ TTS synthesis failed!")
             return False
         
-        print(f"✅ TTS synthesis successful!")
-        print(f"   Generated {len(tts_audio)} audio samples")
+        console.info(f"✅ TTS synthesis successful!")
+        console.info(f"   Generated {len(tts_audio)} bytes of encoded audio")
+        console.info(f"   Synthesis time: {synthesize_ms:.1f}ms")
         
         # Test playback (optional)
-        print("\n6. Testing audio playback...")
-        print("   Playing back the synthesized audio...")
-        print("   (You should hear the TTS output)")
+        console.info("\n6. Testing audio playback...")
+        console.info("   Playing back the synthesized audio...")
+        console.info("   (You should hear the TTS output)")
+        console_handler.flush()
         
-        audio_service.play(tts_audio)
+        svc.play(tts_audio)
         
-        print("✅ Audio playback completed!")
+        console.info("✅ Audio playback completed!")
         
         # Cleanup
-        print("\n7. Cleaning up...")
-        audio_service.cleanup()
+        console.info("\n7. Cleaning up...")
+        release()
         
-        print("\n🎉 All audio tests passed!")
+        console.info("\n🎉 All audio tests passed!")
         return True
         
     except Exception as e:
-        print(f"❌ Audio test failed: {e}")
+        console.error(f"❌ Audio test failed: {e}")
         logger.exception("Audio test failed")
         return False
 
 def test_microphone_permissions():
     """Test if microphone permissions are working."""
-    print("\n🔍 Testing Microphone Permissions")
-    print("=" * 50)
+    console.info("\n🔍 Testing Microphone Permissions")
+    console.info("=" * 50)
     
     try:
         import pyaudio
@@ -131,14 +158,14 @@ def test_microphone_permissions():
         p = pyaudio.PyAudio()
         
         # List audio devices
-        print("Available audio devices:")
+        console.info("Available audio devices:")
         for i in range(p.get_device_count()):
             info = p.get_device_info_by_index(i)
             if info['maxInputChannels'] > 0:
-                print(f"  Device {i}: {info['name']} (Input channels: {info['maxInputChannels']})")
+                console.info(f"  Device {i}: {info['name']} (Input channels: {info['maxInputChannels']})")
         
         # Test opening a stream
-        print("\nTesting microphone access...")
+        console.info("\nTesting microphone access...")
         stream = p.open(
             format=pyaudio.paInt16,
             channels=1,
@@ -147,7 +174,7 @@ def test_microphone_permissions():
             frames_per_buffer=1024
         )
         
-        print("✅ Microphone access successful!")
+        console.info("✅ Microphone access successful!")
         
         # Close stream
         stream.stop_stream()
@@ -157,31 +184,33 @@ def test_microphone_permissions():
         return True
         
     except Exception as e:
-        print(f"❌ Microphone permission test failed: {e}")
+        console.error(f"❌ Microphone permission test failed: {e}")
         return False
 
 if __name__ == "__main__":
-    print("🧪 Audio I/O Direct Test")
-    print("=" * 50)
+    console.info("🧪 Audio I/O Direct Test")
+    console.info("=" * 50)
     
     # Test microphone permissions first
     mic_ok = test_microphone_permissions()
+    console_handler.flush()
     
     if not mic_ok:
-        print("\n❌ Microphone permissions test failed!")
-        print("Please check:")
-        print("1. Microphone is connected and working")
-        print("2. Microphone permissions are granted")
-        print("3. No other applications are using the microphone")
+        console.error("\n❌ Microphone permissions test failed!")
+        console.info("Please check:")
+        console.info("1. Microphone is connected and working")
+        console.info("2. Microphone permissions are granted")
+        console.info("3. No other applications are using the microphone")
         sys.exit(1)
     
     # Test full audio I/O
     audio_ok = test_audio_io()
+    console_handler.flush()
     
     if audio_ok:
-        print("\n🎉 All audio tests passed!")
-        print("The audio system is working correctly.")
+        console.info("\n🎉 All audio tests passed!")
+        console.info("The audio system is working correctly.")
     else:
-        print("\n❌ Audio tests failed!")
-        print("Please check the error messages above.")
+        console.error("\n❌ Audio tests failed!")
+        console.info("Please check the error messages above.")
         sys.exit(1)
@@ -10,9 +10,14 @@ from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
-from src.services.google_audio_io import GoogleAudioIOService
+# Shared helper next to this script, whether run directly or imported as scripts.*
+if __package__:
+    from ._audio import google_audio_service, health_status, release
+else:
+    from _audio import google_audio_service, health_status, release
 
 def test_google_audio():
     """Test Google TTS and STT."""
@@ -22,11 +27,11 @@ def test_google_audio():
     try:
         # Initialize service
         print("1. Initializing Google Audio I/O Service...")
-        audio_service = GoogleAudioIOService()
+        svc = google_audio_service()
         
         # Check health
         print("2. Checking service health...")
-        health = audio_service.get_health_status()
+        health = health_status(google_audio_service)
         print(f"   Health Status: {health}")
         
         if health.get('overall') != 'healthy':
@@ -40,7 +45,7 @@ def test_google_audio():
         test_text = "Hello, this is a test of Google Text to Speech. Can you hear me clearly?"
         print(f"   Synthesizing: '{test_text}'")
         
-        tts_audio = audio_service.synthesize(test_text)
+        tts_audio = svc.synthesize(test_text)
         
         if not tts_audio:
             print("❌ TTS synthesis failed!")
@@ -51,7 +56,7 @@ def test_google_audio():
         # Test playback
         print("\n4. Testing audio playback...")
         print("   Playing TTS audio...")
-        audio_service.play(tts_audio)
+        svc.play(tts_audio)
         print("   (You should hear the TTS output)")
         
         # Test STT
@@ -66,7 +71,7 @@ def test_google_audio():
         print("   🎤 RECORDING NOW - SPEAK CLEARLY!")
         
         # Record audio
-        audio_data = audio_service.record(duration=3.0)
+        audio_data = svc.record(duration=3.0)
         
         if audio_data is None or len(audio_data) == 0:
             print("❌ No audio recorded!")
@@ -76,7 +81,7 @@ def test_google_audio():
         
         # Transcribe
         print("\n6. Testing Google STT transcription...")
-        transcribed_text = audio_service.transcribe(audio_data)
+        transcribed_text = svc.transcribe(audio_data)
         
         if not transcribed_text or not transcribed_text.strip():
             print("❌ No speech detected!")
@@ -87,7 +92,7 @@ def test_google_audio():
         
         # Cleanup
         print("\n7. Cleaning up...")
-        audio_service.cleanup()
+        release()
         
         print("\n🎉 All Google Audio tests passed!")
         return True
@@ -6,14 +6,20 @@ import requests
 import json
 import sys
 
+# Shared helper next to this script, whether run directly or imported as scripts.*
+if __package__:
+    from ._http import SESSION, json_body
+else:
+    from _http import SESSION, json_body
+
 def test_health_endpoint():
     """Test the /health endpoint."""
     try:
         # Test health endpoint
-        response = requests.get("http://localhost:8000/health", timeout=5)
+        response = SESSION.get("http://localhost:8000/health", timeout=5)
         
         if response.status_code == 200:
-            data = response.json()
+            data = json_body(response)
             print("Health check passed!")
             print(f"Status: {data.get('status')}")
             print(f"Version: {data.get('version')}")
@@ -34,10 +40,10 @@ def test_health_endpoint():
 def test_root_endpoint():
     """Test the root endpoint."""
     try:
-        response = requests.get("http://localhost:8000/", timeout=5)
+        response = SESSION.get("http://localhost:8000/", timeout=5)
         
         if response.status_code == 200:
-            data = response.json()
+            data = json_body(response)
             print("Root endpoint working!")
             print(f"Message: {data.get('message')}")
             return True
@@ -6,17 +6,20 @@ Simple microphone level test to check if audio is being captured properly.
 import sys
 import os
 import time
-import numpy as np
+from collections import deque
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-import pyaudio
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 def test_microphone_level():
     """Test microphone input levels in real-time."""
+    # Imported here so loading the module does not initialize PortAudio
+    import numpy as np
+    import pyaudio
+    
     print("🎤 Microphone Level Test")
     print("=" * 50)
     print("Speak into your microphone and watch the levels...")
@@ -24,7 +27,8 @@ def test_microphone_level():
     print()
     
     # Audio parameters
-    CHUNK = 1024
+    CHUNK = 1024  # samples per level measurement
+    BUFFER = 4096  # frames PyAudio delivers per callback
     FORMAT = pyaudio.paInt16
     CHANNELS = 1
     RATE = 16000
@@ -32,6 +36,14 @@ def test_microphone_level():
     # Initialize PyAudio
     p = pyaudio.PyAudio()
     
+    # Ring of the most recent captured buffers, filled by the audio callback
+    # so capture runs independently of the 10 Hz display loop
+    frames = deque(maxlen=4)
+    
+    def on_audio(in_data, frame_count, time_info, status):
+        frames.append(in_data)
+        return (None, pyaudio.paContinue)
+    
     try:
         # Open stream
         stream = p.open(
@@ -39,26 +51,36 @@ def test_microphone_level():
             channels=CHANNELS,
             rate=RATE,
             input=True,
-            frames_per_buffer=CHUNK
+            frames_per_buffer=BUFFER,
+            stream_callback=on_audio
         )
         
         print("Listening... (Speak now!)")
         print("Level: |" + "=" * 50 + "|")
         
+        # Reused magnitude buffer; int32 so abs(-32768) cannot overflow
+        magnitude = np.empty(CHUNK, dtype=np.int32)
+        percent_per_sample = 100 / 32768
+        
         while True:
-            # Read audio data
-            data = stream.read(CHUNK, exception_on_overflow=False)
+            # Small delay
+            time.sleep(0.1)
+            if not frames:
+                continue
             
-            # Convert to numpy array
-            audio_data = np.frombuffer(data, dtype=np.int16)
+            # View the newest CHUNK samples of the latest buffer without copying
+            audio_data = np.frombuffer(frames[-1], dtype=np.int16)[-CHUNK:]
+            if len(audio_data) < CHUNK:
+                continue
             
             # Calculate level
-            level = np.abs(audio_data).mean()
-            max_level = np.abs(audio_data).max()
+            np.abs(audio_data, out=magnitude, dtype=np.int32)
+            level = magnitude.mean()
+            max_level = magnitude.max()
             
             # Convert to percentage
-            level_percent = min(100, (level / 32768) * 100)
-            max_percent = min(100, (max_level / 32768) * 100)
+            level_percent = min(100, level * percent_per_sample)
+            max_percent = min(100, max_level * percent_per_sample)
             
             # Create visual level bar
             bar_length = int(level_percent / 2)  # Scale to 50 chars
@@ -75,9 +97,6 @@ def test_microphone_level():
             # Print level
             print(f"\r{color} Level: {level_percent:5.1f}% |{bar}| Max: {max_percent:5.1f}%", end="", flush=True)
             
-            # Small delay
-            time.sleep(0.1)
-            
     except KeyboardInterrupt:
         print("\n\nStopping microphone test...")
     except Exception as e:
@@ -2,21 +2,71 @@
 """
 Test script to verify Ollama integration with Phi3.
 """
+import asyncio
+import functools
+import re
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from src.services.llm_service import LLMService
 
+# Product/question pairs covering each prompt template
+QUESTION_TEST_CASES = (
+    ("milk", "what are the ingredients in milk"),
+    ("yogurt", "how many calories in yogurt"),
+    ("cheese", "what is the price of cheese"),
+    ("bread", "is this product gluten free"),
+    ("cereal", "tell me about this product")
+)
+
+# Questions whose answers must not mention where products are
+LEAKAGE_TEST_QUESTIONS = (
+    "what are the ingredients in milk",
+    "how many calories in yogurt",
+    "what is the price of cheese",
+    "is this product gluten free",
+    "tell me about this product"
+)
+
+# Words that would reveal store locations, matched in a single scan of each answer
+LOCATION_WORDS = ("aisle", "section", "shelf", "bay", "where", "located", "find", "near")
+LOCATION_PATTERN = re.compile("|".join(map(re.escape, LOCATION_WORDS)))
+
+@functools.lru_cache(maxsize=1)
+def _service():
+    """One LLMService shared by every test, so its HTTP connections stay warm."""
+    return LLMService()
+
+def _warm_up_model():
+    """Load the model with a one-token request and keep it resident for the run."""
+    service = _service()
+    try:
+        service.session.post(
+            f"{service.base_url}/api/generate",
+            json={
+                "model": service.model_name,
+                "prompt": ".",
+                "stream": False,
+                "keep_alive": "1h",
+                "options": {"num_predict": 1}
+            },
+            timeout=service.timeout
+        )
+    except Exception as e:
+        print(f"Model warm-up failed: {e}")
+
 def test_ollama_connection():
     """Test basic Ollama connection."""
     print("Testing Ollama Connection...")
     
-    service = LLMService()
+    service = _service()
     
     # Test health status
     health = service.get_health_status()
@@ -33,7 +83,7 @@ def test_llm_generation():
     """Test LLM text generation."""
     print("\nTesting LLM Generation...")
     
-    service = LLMService()
+    service = _service()
     
     # Test simple generation
     try:
@@ -58,35 +108,37 @@ def test_llm_generation():
         print(f"- LLM generation failed: {e}")
         return False
 
+async def _ask_all(service, test_cases):
+    """Send all prompts at once; exceptions are returned in place of responses."""
+    # generate_info_answer is blocking, so each call runs on a worker thread.
+    # Ollama only batches them if the server allows it (OLLAMA_NUM_PARALLEL).
+    return await asyncio.gather(
+        *[asyncio.to_thread(service.generate_info_answer, product, question)
+          for product, question in test_cases],
+        return_exceptions=True
+    )
+
 def test_different_question_types():
     """Test different types of questions."""
     print("\nTesting Different Question Types...")
     
-    service = LLMService()
+    service = _service()
     
-    test_cases = [
-        ("milk", "what are the ingredients in milk"),
-        ("yogurt", "how many calories in yogurt"),
-        ("cheese", "what is the price of cheese"),
-        ("bread", "is this product gluten free"),
-        ("cereal", "tell me about this product")
-    ]
+    test_cases = QUESTION_TEST_CASES
     
     passed = 0
     total = len(test_cases)
     
-    for product, question in test_cases:
-        try:
-            response = service.generate_info_answer(product, question)
-            
-            if response.answer and len(response.answer) > 10:
-                print(f"+ {question[:30]}... - Generated response")
-                passed += 1
-            else:
-                print(f"- {question[:30]}... - Empty or invalid response")
-                
-        except Exception as e:
-            print(f"- {question[:30]}... - Error: {e}")
+    responses = asyncio.run(_ask_all(service, test_cases))
+    
+    for (product, question), response in zip(test_cases, responses):
+        if isinstance(response, Exception):
+            print(f"- {question[:30]}... - Error: {response}")
+        elif response.answer and len(response.answer) > 10:
+            print(f"+ {question[:30]}... - Generated response")
+            passed += 1
+        else:
+            print(f"- {question[:30]}... - Empty or invalid response")
     
     success_rate = passed / total
     print(f"\nSuccess Rate: {passed}/{total} ({success_rate:.1%})")
@@ -97,15 +149,9 @@ def test_no_location_leakage():
     """Test that responses don't contain location information."""
     print("\nTesting No Location Leakage...")
     
-    service = LLMService()
+    service = _service()
     
-    test_questions = [
-        "what are the ingredients in milk",
-        "how many calories in yogurt",
-        "what is the price of cheese",
-        "is this product gluten free",
-        "tell me about this product"
-    ]
+    test_questions = LEAKAGE_TEST_QUESTIONS
     
     violations = 0
     total = len(test_questions)
@@ -113,14 +159,10 @@ def test_no_location_leakage():
     for question in test_questions:
         try:
             response = service.generate_info_answer("test product", question)
-            answer_lower = response.answer.lower()
-            
-            location_words = ["aisle", "section", "shelf", "bay", "where", "located", "find", "near"]
-            for word in location_words:
-                if word in answer_lower:
-                    print(f"- Location word '{word}' found in: {response.answer}")
-                    violations += 1
-                    break
+            hit = LOCATION_PATTERN.search(response.answer.lower())
+            if hit:
+                print(f"- Location word '{hit.group()}' found in: {response.answer}")
+                violations += 1
             else:
                 print(f"+ No location leakage in: {response.answer[:50]}...")
                 
@@ -139,21 +181,37 @@ def main():
     print("=" * 40)
     
     tests = [
-        ("Ollama Connection", test_ollama_connection),
         ("LLM Generation", test_llm_generation),
         ("Different Question Types", test_different_question_types),
         ("No Location Leakage", test_no_location_leakage)
     ]
     
     passed = 0
-    total = len(tests)
+    total = len(tests) + 1
     
-    for test_name, test_func in tests:
-        print(f"\n{test_name}:")
-        if test_func():
-            passed += 1
-        else:
-            print(f"  FAILED")
+    # The connection check is cheap and gates the LLM tests
+    print("\nOllama Connection:")
+    if test_ollama_connection():
+        passed += 1
+        
+        # Pay the model load once, outside the tests
+        _warm_up_model()
+        
+        # The LLM tests are independent, so run them side by side on the
+        # shared service; their output may interleave
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = {test_name: executor.submit(test_func) for test_name, test_func in tests}
+            results = {test_name: future.result() for test_name, future in futures.items()}
+        
+        print()
+        for test_name, _ in tests:
+            if results[test_name]:
+                passed += 1
+                print(f"{test_name}: passed")
+            else:
+                print(f"{test_name}: FAILED")
+    else:
+        print("  FAILED - skipping LLM tests")
     
     print("\n" + "=" * 40)
     print(f"Test Results: {passed}/{total} tests passed")
@@ -3,12 +3,20 @@
 Simple test to check Ollama connectivity and basic LLM functionality.
 """
 import sys
+import time
 import requests
 from pathlib import Path
 
+# Shared helper next to this script, whether run directly or imported as scripts.*
+if __package__:
+    from ._http import SESSION, json_body, json_loads
+else:
+    from _http import SESSION, json_body, json_loads
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 def test_ollama_connection():
     """Test basic Ollama connection."""
@@ -16,17 +24,18 @@ def test_ollama_connection():
     
     try:
         # Test if Ollama is running
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
+        response = SESSION.get("http://localhost:11434/api/tags", timeout=5)
         
         if response.status_code == 200:
-            models = response.json().get("models", [])
+            models = json_body(response).get("models", [])
             print(f"+ Ollama is running! Found {len(models)} models:")
             
             for model in models:
                 print(f"  - {model.get('name', 'Unknown')}")
             
-            # Check if phi3 is available
-            phi3_available = any("phi3" in model.get("name", "").lower() for model in models)
+            # Check if phi3 is available (names carry a tag, e.g. "phi3:latest")
+            model_names = {model.get("name", "").split(":")[0].lower() for model in models}
+            phi3_available = "phi3" in model_names
             
             if phi3_available:
                 print("+ Phi3 model is available!")
@@ -53,29 +62,44 @@ def test_simple_generation():
     print("\nTesting Simple Text Generation...")
     
     try:
-        # Test simple generation
-        response = requests.post(
+        # Test simple generation, streamed so tokens are read as they arrive
+        start = time.perf_counter_ns()
+        with SESSION.post(
             "http://localhost:11434/api/generate",
             json={
                 "model": "phi3",
                 "prompt": "What are the ingredients in milk?",
-                "stream": False,
+                "stream": True,
                 "options": {
                     "temperature": 0.3,
                     "num_predict": 100
                 }
             },
+            stream=True,
             timeout=30
-        )
+        ) as response:
+            if response.status_code != 200:
+                print(f"- Generation failed: {response.status_code} - {response.text}")
+                return False
+            
+            # Each line is one JSON object carrying the next piece of the answer
+            chunks = []
+            first_token_ms = None
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                result = json_loads(line)
+                if first_token_ms is None:
+                    first_token_ms = (time.perf_counter_ns() - start) / 1e6
+                chunks.append(result.get("response", ""))
+                if result.get("done"):
+                    break
         
-        if response.status_code == 200:
-            result = response.json()
-            answer = result.get("response", "")
-            print(f"+ Generated response: {answer[:100]}...")
-            return True
-        else:
-            print(f"- Generation failed: {response.status_code} - {response.text}")
-            return False
+        answer = "".join(chunks)
+        print(f"+ Generated response: {answer[:100]}...")
+        if first_token_ms is not None:
+            print(f"  First token after {first_token_ms:.1f}ms")
+        return True
             
     except Exception as e:
         print(f"- Generation error: {e}")
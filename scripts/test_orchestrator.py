@@ -3,11 +3,13 @@
 Test script to verify orchestrator functionality.
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from src.api.orchestrator import BackendOrchestrator
 
@@ -19,9 +21,15 @@ def test_orchestrator():
     orchestrator = BackendOrchestrator()
     print(f"Orchestrator created with DB path: {orchestrator.db_path}")
     
+    # The two queries are independent; run them side by side and report in order.
+    # The DB layer opens a connection per query, so they do not contend on one.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        location_future = executor.submit(orchestrator.process_text_query, "where is the milk")
+        info_future = executor.submit(orchestrator.process_text_query, "what are the ingredients in bread")
+    
     # Test location query
     print("\nTesting location query: 'where is the milk'")
-    result = orchestrator.process_text_query("where is the milk")
+    result = location_future.result()
     print(f"Query type: {result.get('query_type')}")
     print(f"Normalized product: {result.get('normalized_product')}")
     print(f"Matches count: {len(result.get('matches', []))}")
@@ -34,7 +42,7 @@ def test_orchestrator():
     
     # Test information query
     print("\nTesting information query: 'what are the ingredients in bread'")
-    result = orchestrator.process_text_query("what are the ingredients in bread")
+    result = info_future.result()
     print(f"Query type: {result.get('query_type')}")
     print(f"Normalized product: {result.get('normalized_product')}")
     print(f"Answer: {result.get('answer', 'No answer')[:100]}...")
@@ -2,59 +2,27 @@
 """
 Simple test script for voice I/O components.
 """
+import importlib.util
 import sys
 import time
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 def test_audio_imports():
-    """Test if audio libraries can be imported."""
+    """Test if audio libraries are installed."""
     print("Testing Audio Library Imports...")
     
-    try:
-        import numpy as np
-        print("+ numpy imported successfully")
-    except ImportError as e:
-        print(f"- numpy import failed: {e}")
-        return False
-    
-    try:
-        import sounddevice as sd
-        print("+ sounddevice imported successfully")
-    except ImportError as e:
-        print(f"- sounddevice import failed: {e}")
-        return False
-    
-    try:
-        import webrtcvad
-        print("+ webrtcvad imported successfully")
-    except ImportError as e:
-        print(f"- webrtcvad import failed: {e}")
-        return False
-    
-    try:
-        import whisper
-        print("+ whisper imported successfully")
-    except ImportError as e:
-        print(f"- whisper import failed: {e}")
-        return False
-    
-    try:
-        import pyttsx3
-        print("+ pyttsx3 imported successfully")
-    except ImportError as e:
-        print(f"- pyttsx3 import failed: {e}")
-        return False
-    
-    try:
-        import scipy
-        print("+ scipy imported successfully")
-    except ImportError as e:
-        print(f"- scipy import failed: {e}")
-        return False
+    # find_spec locates each module without importing it, so heavy packages
+    # such as whisper (which pulls in torch) are not loaded just to check them
+    for module_name in ["numpy", "sounddevice", "webrtcvad", "whisper", "pyttsx3", "scipy"]:
+        if importlib.util.find_spec(module_name) is None:
+            print(f"- {module_name} is not installed")
+            return False
+        print(f"+ {module_name} is available")
     
     return True
 
@@ -130,13 +98,8 @@ def test_tts():
         
         audio_data = service.synthesize(test_text)
         
-        if len(audio_data) >= 0:  # Note: pyttsx3 might return empty array
-            print("+ TTS synthesis completed")
-            
-            # Note: pyttsx3 doesn't easily return audio data for playback
-            # This is a limitation of the current implementation
-            print("Note: pyttsx3 doesn't easily support audio data extraction")
-            print("For full TTS testing, use the voice loop applications")
+        if len(audio_data) > 0:
+            print(f"+ TTS synthesis completed ({len(audio_data)} bytes of encoded audio)")
             
             service.cleanup()
             return True
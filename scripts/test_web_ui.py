@@ -2,14 +2,23 @@
 """
 Test script for the Voice Web UI.
 """
+import os
 import sys
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Shared helper next to this script, whether run directly or imported as scripts.*
+if __package__:
+    from ._http import SESSION, post_multipart, wav_probe
+else:
+    from _http import SESSION, post_multipart, wav_probe
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 def test_server_health():
     """Test if the server is running and healthy."""
@@ -36,9 +45,15 @@ def test_web_ui_files():
     files_to_check = ["index.html", "styles.css", "app.js"]
     all_exist = True
     
+    # List the directory once rather than stat-ing each file
+    try:
+        with os.scandir(web_dir) as entries:
+            present = {entry.name for entry in entries}
+    except FileNotFoundError:
+        present = set()
+    
     for file_name in files_to_check:
-        file_path = web_dir / file_name
-        if file_path.exists():
+        if file_name in present:
             print(f"+ {file_name} exists")
         else:
             print(f"- {file_name} missing")
@@ -69,30 +84,34 @@ def test_static_file_serving():
 def test_api_endpoints():
     """Test API endpoints."""
     try:
-        # Test text endpoint
-        response = requests.post(
-            "http://localhost:8000/api/v1/ask",
-            json={"query": "where is the milk", "session_id": "test"},
-            timeout=10
-        )
+        # Text and voice requests are independent, so send them together
+        # over the shared session's connection pool
+        fields = {
+            "audio_file": ("test.wav", wav_probe(), "audio/wav"),  # real, cached WAV
+            "session_id": "test",
+            "return_audio": "false"
+        }
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            text_future = executor.submit(
+                SESSION.post,
+                "http://localhost:8000/api/v1/ask",
+                json={"query": "where is the milk", "session_id": "test"},
+                timeout=10
+            )
+            voice_future = executor.submit(
+                post_multipart, SESSION, "http://localhost:8000/api/v1/ask-voice", fields, timeout=10
+            )
         
+        # Test text endpoint
+        response = text_future.result()
         if response.status_code == 200:
             print("+ Text API endpoint working")
         else:
             print(f"- Text API endpoint failed: {response.status_code}")
             return False
         
-        # Test voice endpoint (with mock data)
-        files = {"audio_file": ("test.webm", b"mock audio data", "audio/webm")}
-        data = {"session_id": "test", "return_audio": "false"}
-        
-        response = requests.post(
-            "http://localhost:8000/api/v1/ask-voice",
-            files=files,
-            data=data,
-            timeout=10
-        )
-        
+        # Test voice endpoint
+        response = voice_future.result()
         if response.status_code == 200:
             print("+ Voice API endpoint working")
             return True
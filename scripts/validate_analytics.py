@@ -3,25 +3,59 @@
 Comprehensive test to verify analytics system is working properly.
 This script will test all API endpoints and check if analytics are being tracked.
 """
-import requests
 import json
+import sys
 import time
+import socket
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import requests
+
+# Shared helper next to this script, whether run directly or imported as scripts.*
+if __package__:
+    from ._http import SESSION
+else:
+    from _http import SESSION
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from config.settings import DATABASE_CONFIG
+
+# Database the API server records analytics into
+DB_PATH = Path(DATABASE_CONFIG["path"])
+
+# Sample of the most recent tracked queries, shared by every check
+RECENT_QUERIES_SQL = """
+    SELECT query_text, query_type, input_method, success, timestamp 
+    FROM query_analytics 
+    ORDER BY timestamp DESC 
+    LIMIT 5
+"""
+
 def check_server_status():
     """Check if the server is running."""
+    # Fail fast when nothing is listening before paying for an HTTP request
     try:
-        response = requests.get("http://localhost:8000/health", timeout=5)
+        socket.create_connection(("localhost", 8000), timeout=0.2).close()
+    except OSError:
+        return False
+    
+    try:
+        response = SESSION.get("http://localhost:8000/health", timeout=(0.5, 2.0))
         return response.status_code == 200
-    except:
+    except (requests.ConnectionError, requests.Timeout):
         return False
 
 def test_text_query():
     """Test text query tracking."""
     print("Testing text query analytics...")
     try:
-        response = requests.post(
+        response = SESSION.post(
             "http://localhost:8000/api/v1/ask",
             json={"query": "Where can I find milk?", "session_id": "analytics_test_session"},
             timeout=10
@@ -37,6 +71,16 @@ def test_text_query():
         print(f"- Text query error: {e}")
         return False
 
+def probe_endpoint(endpoint):
+    """GET one endpoint; returns whether it succeeded and the line to report."""
+    try:
+        response = SESSION.get(f"http://localhost:8000{endpoint}", timeout=5)
+        if response.status_code == 200:
+            return True, f"+ {endpoint}"
+        return False, f"- {endpoint} - Status: {response.status_code}"
+    except Exception as e:
+        return False, f"- {endpoint} - Error: {e}"
+
 def test_analytics_api():
     """Test analytics API endpoints."""
     print("Testing analytics API endpoints...")
@@ -48,17 +92,13 @@ def test_analytics_api():
         "/api/v1/analytics/recent?limit=10"
     ]
     
+    # The endpoints are independent, so probe them all at once;
+    # map() keeps the report in endpoint order
     success_count = 0
-    for endpoint in endpoints:
-        try:
-            response = requests.get(f"http://localhost:8000{endpoint}", timeout=5)
-            if response.status_code == 200:
-                print(f"+ {endpoint}")
-                success_count += 1
-            else:
-                print(f"- {endpoint} - Status: {response.status_code}")
-        except Exception as e:
-            print(f"- {endpoint} - Error: {e}")
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        for ok, line in executor.map(probe_endpoint, endpoints):
+            print(line)
+            success_count += ok
     
     return success_count == len(endpoints)
 
@@ -68,12 +108,11 @@ def check_database_queries():
     
     try:
         # Connect to the database
-        db_path = Path("d:/grocery_assistant_project/data/products.db")
-        if not db_path.exists():
-            print(f"- Database file not found at {db_path}")
+        if not DB_PATH.is_file():
+            print(f"- Database file not found at {DB_PATH}")
             return False
         
-        with sqlite3.connect(db_path) as conn:
+        with sqlite3.connect(DB_PATH) as conn:
             cursor = conn.cursor()
             
             # Check if analytics tables exist
@@ -92,19 +131,18 @@ def check_database_queries():
             recent_count = cursor.fetchone()[0]
             print(f"Recent queries (last hour): {recent_count}")
             
-            # Get sample of recent queries
-            cursor.execute("""
-                SELECT query_text, query_type, input_method, success, timestamp 
-                FROM query_analytics 
-                ORDER BY timestamp DESC 
-                LIMIT 5
-            """)
-            recent_queries = cursor.fetchall()
+            # Stream a sample of recent queries as named rows
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute(RECENT_QUERIES_SQL)
+            found = False
+            while rows := cursor.fetchmany(5):
+                if not found:
+                    print("Recent queries:")
+                    found = True
+                for query in rows:
+                    print(f"  - {query['query_text'][:30]}... | Type: {query['query_type']} | Method: {query['input_method']} | Success: {query['success']} | Time: {query['timestamp']}")
             
-            if recent_queries:
-                print("Recent queries:")
-                for query in recent_queries:
-                    print(f"  - {query[0][:30]}... | Type: {query[1]} | Method: {query[2]} | Success: {query[3]} | Time: {query[4]}")
+            if found:
                 return True
             else:
                 print("- No queries found in database")
@@ -118,7 +156,7 @@ def test_analytics_dashboard():
     """Test analytics dashboard accessibility."""
     print("Testing analytics dashboard...")
     try:
-        response = requests.get("http://localhost:8000/analytics", timeout=5)
+        response = SESSION.get("http://localhost:8000/analytics", timeout=5)
         if response.status_code == 200:
             print("+ Analytics dashboard accessible")
             return True
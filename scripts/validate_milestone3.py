@@ -3,150 +3,182 @@
 Validation script for Milestone 3: Keyword Router and Normalization
 Tests accuracy and disambiguation handling.
 """
+import functools
+import sqlite3
 import sys
 import os
 from pathlib import Path
 
+import numpy as np
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from src.nlu.router import QueryRouter
 from config.settings import DATABASE_CONFIG
 
+# Database under test; main() checks once that it exists
+DB_PATH = Path(DATABASE_CONFIG["path"])
+
+@functools.lru_cache(maxsize=1)
+def get_router(db_path: str) -> QueryRouter:
+    """Return the QueryRouter shared by the tests for db_path."""
+    return QueryRouter(db_path)
+
+# Edge-case inputs for the router, built once at import
+EDGE_CASES = (
+    "",  # Empty string
+    "   ",  # Whitespace only
+    "where is the milk?",  # With punctuation
+    "find APPLES",  # All caps
+    "locate bread!!!",  # Multiple punctuation
+    "which aisle has chicken?",  # Question mark
+    "what's the price?",  # Apostrophe
+    "milk 2%",  # With numbers
+    "12 pack apples",  # With numbers
+    "1 gallon milk",  # With numbers
+    "5 lb chicken",  # With numbers
+    "where is the milke",  # Typo
+    "find aplles",  # Typo
+    "locate bred",  # Typo
+    "which aisl has chicken",  # Typo
+    "very long query " * 50,  # Very long
+    "where is le lait",  # Mixed language
+    "find manzanas",  # Mixed language
+)
+
+# Curated test dataset of 100+ utterances with their expected routes
+TEST_DATASET = (
+    # Location queries (50)
+    ("where is the milk", "location"),
+    ("find apples", "location"),
+    ("locate bread", "location"),
+    ("which aisle has chicken", "location"),
+    ("what section is cheese in", "location"),
+    ("near the entrance", "location"),
+    ("next to the dairy", "location"),
+    ("beside the meat counter", "location"),
+    ("close to the bakery", "location"),
+    ("around the produce section", "location"),
+    ("by the frozen foods", "location"),
+    ("left side of aisle 5", "location"),
+    ("right side of aisle 3", "location"),
+    ("front of the store", "location"),
+    ("back of the store", "location"),
+    ("top shelf", "location"),
+    ("bottom shelf", "location"),
+    ("middle shelf", "location"),
+    ("which aisle has organic milk", "location"),
+    ("where can I find gluten-free bread", "location"),
+    ("locate the dairy section", "location"),
+    ("find the meat department", "location"),
+    ("where is the produce area", "location"),
+    ("which section has frozen foods", "location"),
+    ("near the checkout", "location"),
+    ("by the registers", "location"),
+    ("close to the exit", "location"),
+    ("around the corner", "location"),
+    ("in aisle 7", "location"),
+    ("on shelf 3", "location"),
+    ("at the end cap", "location"),
+    ("in the display case", "location"),
+    ("where are the eggs", "location"),
+    ("find the yogurt", "location"),
+    ("locate the butter", "location"),
+    ("which aisle has pasta", "location"),
+    ("where is the rice", "location"),
+    ("find the cereal", "location"),
+    ("locate the snacks", "location"),
+    ("which section has beverages", "location"),
+    ("where are the canned goods", "location"),
+    ("find the condiments", "location"),
+    ("locate the spices", "location"),
+    ("which aisle has cleaning supplies", "location"),
+    ("where are the paper products", "location"),
+    ("find the pet food", "location"),
+    ("locate the baby products", "location"),
+    ("which section has health items", "location"),
+    ("where are the vitamins", "location"),
+    
+    # Information queries (50)
+    ("what are the ingredients in milk", "information"),
+    ("nutrition information for apples", "information"),
+    ("how many calories in bread", "information"),
+    ("is chicken gluten free", "information"),
+    ("what is the price of cheese", "information"),
+    ("return policy for this product", "information"),
+    ("expiration date", "information"),
+    ("ingredients list", "information"),
+    ("nutrition facts", "information"),
+    ("calorie content", "information"),
+    ("protein amount", "information"),
+    ("carbohydrate content", "information"),
+    ("fat content", "information"),
+    ("sugar content", "information"),
+    ("sodium level", "information"),
+    ("fiber content", "information"),
+    ("vitamin content", "information"),
+    ("mineral content", "information"),
+    ("is it vegan", "information"),
+    ("is it vegetarian", "information"),
+    ("gluten free", "information"),
+    ("dairy free", "information"),
+    ("lactose free", "information"),
+    ("halal certified", "information"),
+    ("kosher certified", "information"),
+    ("keto friendly", "information"),
+    ("paleo friendly", "information"),
+    ("organic certified", "information"),
+    ("natural ingredients", "information"),
+    ("non-gmo", "information"),
+    ("allergen information", "information"),
+    ("contains nuts", "information"),
+    ("may contain soy", "information"),
+    ("egg free", "information"),
+    ("shellfish free", "information"),
+    ("fish free", "information"),
+    ("what is the size", "information"),
+    ("what is the weight", "information"),
+    ("what is the volume", "information"),
+    ("package dimensions", "information"),
+    ("container size", "information"),
+    ("warranty information", "information"),
+    ("guarantee details", "information"),
+    ("best before date", "information"),
+    ("sell by date", "information"),
+    ("use by date", "information"),
+    ("fresh or frozen", "information"),
+    ("refrigerated or not", "information"),
+    ("how to cook", "information"),
+    ("preparation instructions", "information"),
+    ("cooking directions", "information"),
+    ("serving suggestions", "information"),
+    ("recipe ideas", "information"),
+    ("usage instructions", "information"),
+    ("storage instructions", "information"),
+    ("how to store", "information"),
+    ("quality rating", "information"),
+    ("customer reviews", "information"),
+    ("recommendations", "information"),
+    ("popular products", "information"),
+    ("best sellers", "information"),
+    ("what is this product", "information"),
+    ("tell me about this", "information"),
+    ("explain this item", "information"),
+    ("describe this product", "information"),
+)
+
 def create_test_dataset():
-    """Create a curated test dataset of 100+ utterances."""
-    return [
-        # Location queries (50)
-        ("where is the milk", "location"),
-        ("find apples", "location"),
-        ("locate bread", "location"),
-        ("which aisle has chicken", "location"),
-        ("what section is cheese in", "location"),
-        ("near the entrance", "location"),
-        ("next to the dairy", "location"),
-        ("beside the meat counter", "location"),
-        ("close to the bakery", "location"),
-        ("around the produce section", "location"),
-        ("by the frozen foods", "location"),
-        ("left side of aisle 5", "location"),
-        ("right side of aisle 3", "location"),
-        ("front of the store", "location"),
-        ("back of the store", "location"),
-        ("top shelf", "location"),
-        ("bottom shelf", "location"),
-        ("middle shelf", "location"),
-        ("which aisle has organic milk", "location"),
-        ("where can I find gluten-free bread", "location"),
-        ("locate the dairy section", "location"),
-        ("find the meat department", "location"),
-        ("where is the produce area", "location"),
-        ("which section has frozen foods", "location"),
-        ("near the checkout", "location"),
-        ("by the registers", "location"),
-        ("close to the exit", "location"),
-        ("around the corner", "location"),
-        ("in aisle 7", "location"),
-        ("on shelf 3", "location"),
-        ("at the end cap", "location"),
-        ("in the display case", "location"),
-        ("where are the eggs", "location"),
-        ("find the yogurt", "location"),
-        ("locate the butter", "location"),
-        ("which aisle has pasta", "location"),
-        ("where is the rice", "location"),
-        ("find the cereal", "location"),
-        ("locate the snacks", "location"),
-        ("which section has beverages", "location"),
-        ("where are the canned goods", "location"),
-        ("find the condiments", "location"),
-        ("locate the spices", "location"),
-        ("which aisle has cleaning supplies", "location"),
-        ("where are the paper products", "location"),
-        ("find the pet food", "location"),
-        ("locate the baby products", "location"),
-        ("which section has health items", "location"),
-        ("where are the vitamins", "location"),
-        
-        # Information queries (50)
-        ("what are the ingredients in milk", "information"),
-        ("nutrition information for apples", "information"),
-        ("how many calories in bread", "information"),
-        ("is chicken gluten free", "information"),
-        ("what is the price of cheese", "information"),
-        ("return policy for this product", "information"),
-        ("expiration date", "information"),
-        ("ingredients list", "information"),
-        ("nutrition facts", "information"),
-        ("calorie content", "information"),
-        ("protein amount", "information"),
-        ("carbohydrate content", "information"),
-        ("fat content", "information"),
-        ("sugar content", "information"),
-        ("sodium level", "information"),
-        ("fiber content", "information"),
-        ("vitamin content", "information"),
-        ("mineral content", "information"),
-        ("is it vegan", "information"),
-        ("is it vegetarian", "information"),
-        ("gluten free", "information"),
-        ("dairy free", "information"),
-        ("lactose free", "information"),
-        ("halal certified", "information"),
-        ("kosher certified", "information"),
-        ("keto friendly", "information"),
-        ("paleo friendly", "information"),
-        ("organic certified", "information"),
-        ("natural ingredients", "information"),
-        ("non-gmo", "information"),
-        ("allergen information", "information"),
-        ("contains nuts", "information"),
-        ("may contain soy", "information"),
-        ("egg free", "information"),
-        ("shellfish free", "information"),
-        ("fish free", "information"),
-        ("what is the size", "information"),
-        ("what is the weight", "information"),
-        ("what is the volume", "information"),
-        ("package dimensions", "information"),
-        ("container size", "information"),
-        ("warranty information", "information"),
-        ("guarantee details", "information"),
-        ("best before date", "information"),
-        ("sell by date", "information"),
-        ("use by date", "information"),
-        ("fresh or frozen", "information"),
-        ("refrigerated or not", "information"),
-        ("how to cook", "information"),
-        ("preparation instructions", "information"),
-        ("cooking directions", "information"),
-        ("serving suggestions", "information"),
-        ("recipe ideas", "information"),
-        ("usage instructions", "information"),
-        ("storage instructions", "information"),
-        ("how to store", "information"),
-        ("quality rating", "information"),
-        ("customer reviews", "information"),
-        ("recommendations", "information"),
-        ("popular products", "information"),
-        ("best sellers", "information"),
-        ("what is this product", "information"),
-        ("tell me about this", "information"),
-        ("explain this item", "information"),
-        ("describe this product", "information"),
-    ]
+    """Return the curated test dataset of 100+ utterances."""
+    return TEST_DATASET
 
 def test_classification_accuracy():
     """Test classification accuracy on curated dataset."""
     print("Testing classification accuracy...")
     
-    # Ensure database exists
-    db_path = DATABASE_CONFIG["path"]
-    if not db_path.exists():
-        print("  FAILED: Database does not exist. Run init_db.py first.")
-        return False
-    
-    router = QueryRouter(str(db_path))
+    router = get_router(str(DB_PATH))
     test_cases = create_test_dataset()
     
     correct = 0
@@ -158,9 +190,9 @@ def test_classification_accuracy():
     
     print(f"  Testing {total} queries...")
     
-    for query, expected_route in test_cases:
-        result = router.classify_query(query)
-        
+    results = router.batch_classify([query for query, _ in test_cases])
+    
+    for (query, expected_route), result in zip(test_cases, results):
         if result.route == expected_route:
             correct += 1
             if expected_route == "location":
@@ -192,12 +224,7 @@ def test_disambiguation_handling():
     """Test disambiguation handling for ambiguous queries."""
     print("\nTesting disambiguation handling...")
     
-    db_path = DATABASE_CONFIG["path"]
-    if not db_path.exists():
-        print("  FAILED: Database does not exist. Run init_db.py first.")
-        return False
-    
-    router = QueryRouter(str(db_path))
+    router = get_router(str(DB_PATH))
     
     # Test ambiguous queries that should trigger disambiguation
     ambiguous_queries = [
@@ -243,33 +270,9 @@ def test_edge_cases():
     """Test edge cases and error handling."""
     print("\nTesting edge cases...")
     
-    db_path = DATABASE_CONFIG["path"]
-    if not db_path.exists():
-        print("  FAILED: Database does not exist. Run init_db.py first.")
-        return False
+    router = get_router(str(DB_PATH))
     
-    router = QueryRouter(str(db_path))
-    
-    edge_cases = [
-        "",  # Empty string
-        "   ",  # Whitespace only
-        "where is the milk?",  # With punctuation
-        "find APPLES",  # All caps
-        "locate bread!!!",  # Multiple punctuation
-        "which aisle has chicken?",  # Question mark
-        "what's the price?",  # Apostrophe
-        "milk 2%",  # With numbers
-        "12 pack apples",  # With numbers
-        "1 gallon milk",  # With numbers
-        "5 lb chicken",  # With numbers
-        "where is the milke",  # Typo
-        "find aplles",  # Typo
-        "locate bred",  # Typo
-        "which aisl has chicken",  # Typo
-        "very long query " * 50,  # Very long
-        "where is le lait",  # Mixed language
-        "find manzanas",  # Mixed language
-    ]
+    edge_cases = EDGE_CASES
     
     passed = 0
     total = len(edge_cases)
@@ -298,12 +301,7 @@ def test_confidence_distribution():
     """Test confidence score distribution."""
     print("\nTesting confidence distribution...")
     
-    db_path = DATABASE_CONFIG["path"]
-    if not db_path.exists():
-        print("  FAILED: Database does not exist. Run init_db.py first.")
-        return False
-    
-    router = QueryRouter(str(db_path))
+    router = get_router(str(DB_PATH))
     test_cases = create_test_dataset()
     
     queries = [query for query, _ in test_cases]
@@ -315,20 +313,18 @@ def test_confidence_distribution():
     print(f"  Location queries: {len(location_confidences)}")
     print(f"  Information queries: {len(information_confidences)}")
     
-    if location_confidences:
-        avg_location_confidence = sum(location_confidences) / len(location_confidences)
-        print(f"  Average location confidence: {avg_location_confidence:.3f}")
+    if location_confidences.size:
+        print(f"  Average location confidence: {location_confidences.mean():.3f}")
     
-    if information_confidences:
-        avg_information_confidence = sum(information_confidences) / len(information_confidences)
-        print(f"  Average information confidence: {avg_information_confidence:.3f}")
+    if information_confidences.size:
+        print(f"  Average information confidence: {information_confidences.mean():.3f}")
     
     # Check that confidence scores are reasonable
-    all_confidences = location_confidences + information_confidences
-    if all_confidences:
-        min_confidence = min(all_confidences)
-        max_confidence = max(all_confidences)
-        avg_confidence = sum(all_confidences) / len(all_confidences)
+    all_confidences = np.concatenate((location_confidences, information_confidences))
+    if all_confidences.size:
+        min_confidence = all_confidences.min()
+        max_confidence = all_confidences.max()
+        avg_confidence = all_confidences.mean()
         
         print(f"  Confidence range: {min_confidence:.3f} - {max_confidence:.3f}")
         print(f"  Average confidence: {avg_confidence:.3f}")
@@ -342,6 +338,23 @@ def test_confidence_distribution():
     
     return True
 
+def warm_page_cache(db_path: str):
+    """Touch the tables the router reads so the first test starts on warm pages.
+
+    ProductExtractor loads product_synonyms and products, joined with brands
+    and categories; inventory_locations is never read by the router.
+    """
+    conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        conn.execute("""
+            SELECT (SELECT COUNT(*) FROM products),
+                   (SELECT COUNT(*) FROM product_synonyms),
+                   (SELECT COUNT(*) FROM categories),
+                   (SELECT COUNT(*) FROM brands)
+        """).fetchone()
+    finally:
+        conn.close()
+
 def main():
     """Run all validation tests."""
     print("Milestone 3 Validation: Keyword Router and Normalization")
@@ -354,6 +367,12 @@ def main():
         ("Confidence Distribution", test_confidence_distribution)
     ]
     
+    if not DB_PATH.is_file():
+        print("FAILED: Database does not exist. Run init_db.py first.")
+        return False
+    
+    warm_page_cache(str(DB_PATH))
+    
     passed = 0
     total = len(tests)
     
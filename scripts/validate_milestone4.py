@@ -3,42 +3,68 @@
 Validation script for Milestone 4: Backend Orchestration API
 Tests the unified API with schema-compliant responses.
 """
+import functools
 import sys
 import os
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from src.api.orchestrator import BackendOrchestrator
 from src.api.models import ProductLocationResponse, ProductInfoResponse, ErrorResponse
 from config.settings import DATABASE_CONFIG
+# Shared helper next to this script, whether run directly or imported as scripts.*
+if __package__:
+    from ._output import ThreadOutput
+else:
+    from _output import ThreadOutput
+
+# Database under test; main() checks once that it exists
+DB_PATH = Path(DATABASE_CONFIG["path"])
+
+@functools.lru_cache(maxsize=1)
+def get_orchestrator() -> BackendOrchestrator:
+    """Return the BackendOrchestrator shared by the tests."""
+    return BackendOrchestrator()
+
+@functools.lru_cache(maxsize=1)
+def get_health_status() -> dict:
+    """Return the orchestrator's health, checked once per run."""
+    return get_orchestrator().get_health_status()
+
+# Keys each kind of orchestrator output must carry
+LOCATION_KEYS = frozenset({"query_type", "normalized_product", "matches", "disambiguation_needed", "notes"})
+MATCH_KEYS = frozenset({"product_id", "product_name", "brand", "category", "aisle", "bay", "shelf", "confidence"})
+INFORMATION_KEYS = frozenset({"query_type", "normalized_product", "answer", "confidence"})
+HEALTH_KEYS = frozenset({"database", "llm", "router", "overall"})
+
+# Tests that share no state beyond the cached services and can run concurrently
+PARALLEL_TESTS = frozenset({"Schema Compliance", "Error Handling", "Structured Logging"})
+
+# Tests that issue real LLM calls and are skipped when the backend is not healthy
+LLM_TESTS = frozenset({"Performance"})
 
 def test_orchestrator_functionality():
     """Test orchestrator functionality directly."""
     print("Testing Backend Orchestrator Functionality...")
     
-    # Ensure database exists
-    db_path = DATABASE_CONFIG["path"]
-    if not db_path.exists():
-        print("  FAILED: Database does not exist. Run init_db.py first.")
-        return False
-    
-    orchestrator = BackendOrchestrator()
+    orchestrator = get_orchestrator()
     
     # Test location query
     print("  Testing location query: 'where is the milk'")
     result = orchestrator.process_text_query("where is the milk")
     
     # Validate response structure
-    required_keys = ["query_type", "normalized_product", "matches", "disambiguation_needed", "notes"]
-    for key in required_keys:
-        if key not in result:
-            print(f"    FAILED: Missing key '{key}' in response")
-            return False
+    missing = LOCATION_KEYS - result.keys()
+    if missing:
+        print(f"    FAILED: Missing keys {sorted(missing)} in response")
+        return False
     
     if result["query_type"] != "location":
         print(f"    FAILED: Expected 'location', got '{result['query_type']}'")
@@ -54,22 +80,20 @@ def test_orchestrator_functionality():
         print(f"    PASSED: Found {len(result['matches'])} matches")
         # Validate match structure
         match = result["matches"][0]
-        match_keys = ["product_id", "product_name", "brand", "category", "aisle", "bay", "shelf", "confidence"]
-        for key in match_keys:
-            if key not in match:
-                print(f"    FAILED: Missing key '{key}' in match")
-                return False
+        missing = MATCH_KEYS - match.keys()
+        if missing:
+            print(f"    FAILED: Missing keys {sorted(missing)} in match")
+            return False
     
     # Test information query
     print("  Testing information query: 'what are the ingredients in bread'")
     result = orchestrator.process_text_query("what are the ingredients in bread")
     
     # Validate response structure
-    required_keys = ["query_type", "normalized_product", "answer", "confidence"]
-    for key in required_keys:
-        if key not in result:
-            print(f"    FAILED: Missing key '{key}' in response")
-            return False
+    missing = INFORMATION_KEYS - result.keys()
+    if missing:
+        print(f"    FAILED: Missing keys {sorted(missing)} in response")
+        return False
     
     if result["query_type"] != "information":
         print(f"    FAILED: Expected 'information', got '{result['query_type']}'")
@@ -87,13 +111,12 @@ def test_orchestrator_functionality():
     
     # Test health status
     print("  Testing health status...")
-    health = orchestrator.get_health_status()
+    health = get_health_status()
     
-    required_health_keys = ["database", "llm", "router", "overall"]
-    for key in required_health_keys:
-        if key not in health:
-            print(f"    FAILED: Missing health key '{key}'")
-            return False
+    missing = HEALTH_KEYS - health.keys()
+    if missing:
+        print(f"    FAILED: Missing health keys {sorted(missing)}")
+        return False
     
     print(f"    PASSED: Health status - {health}")
     
@@ -103,7 +126,7 @@ def test_schema_compliance():
     """Test that responses match the required schemas."""
     print("\nTesting Schema Compliance...")
     
-    orchestrator = BackendOrchestrator()
+    orchestrator = get_orchestrator()
     
     # Test location response schema
     print("  Testing location response schema...")
@@ -111,7 +134,7 @@ def test_schema_compliance():
     
     try:
         # Try to create ProductLocationResponse from result
-        location_response = ProductLocationResponse(**result)
+        location_response = ProductLocationResponse.model_validate(result)
         print("    PASSED: Location response matches schema")
     except Exception as e:
         print(f"    FAILED: Location response schema validation failed: {e}")
@@ -123,7 +146,7 @@ def test_schema_compliance():
     
     try:
         # Try to create ProductInfoResponse from result
-        info_response = ProductInfoResponse(**result)
+        info_response = ProductInfoResponse.model_validate(result)
         print("    PASSED: Information response matches schema")
     except Exception as e:
         print(f"    FAILED: Information response schema validation failed: {e}")
@@ -135,7 +158,7 @@ def test_error_handling():
     """Test error handling and edge cases."""
     print("\nTesting Error Handling...")
     
-    orchestrator = BackendOrchestrator()
+    orchestrator = get_orchestrator()
     
     # Test empty query
     print("  Testing empty query...")
@@ -172,7 +195,7 @@ def test_performance():
     """Test performance and latency."""
     print("\nTesting Performance...")
     
-    orchestrator = BackendOrchestrator()
+    orchestrator = get_orchestrator()
     
     # Test multiple queries
     queries = [
@@ -186,11 +209,16 @@ def test_performance():
     total_time = 0
     successful_queries = 0
     
-    for query in queries:
-        start_time = time.time()
+    def timed_query(query):
+        start_time = time.perf_counter()
         result = orchestrator.process_text_query(query)
-        end_time = time.time()
-        
+        return start_time, time.perf_counter(), result
+    
+    # One query at a time: a single Ollama instance serves requests in turn,
+    # so concurrent queries would count queue time against the threshold
+    timings = [timed_query(query) for query in queries]
+    
+    for query, (start_time, end_time, result) in zip(queries, timings):
         latency = (end_time - start_time) * 1000  # Convert to milliseconds
         total_time += latency
         
@@ -223,7 +251,7 @@ def test_logging():
     """Test structured logging functionality."""
     print("\nTesting Structured Logging...")
     
-    orchestrator = BackendOrchestrator()
+    orchestrator = get_orchestrator()
     
     # Test that logging works without errors
     try:
@@ -236,6 +264,9 @@ def test_logging():
 
 def main():
     """Run all validation tests."""
+    # Buffer output and flush once per test instead of on every line
+    sys.stdout.reconfigure(line_buffering=False)
+    
     print("Milestone 4 Validation: Backend Orchestration API")
     print("=" * 60)
     
@@ -247,20 +278,61 @@ def main():
         ("Structured Logging", test_logging)
     ]
     
+    # Building the orchestrator for the health probe would create an
+    # analytics-only database, so check for the real one first
+    if not DB_PATH.is_file():
+        print("FAILED: Database does not exist. Run init_db.py first.")
+        return False
+    
+    # Tests that need a live LLM cannot succeed against a degraded backend,
+    # so skip them up front rather than waiting on calls that will time out
+    health = get_health_status()["overall"]
+    skipped_tests = set() if health == "healthy" else LLM_TESTS
+    if skipped_tests:
+        print(f"\nBackend is {health}; skipping: {', '.join(name for name, _ in tests if name in skipped_tests)}")
+    
     passed = 0
+    skipped = 0
     total = len(tests)
     
+    # Independent tests run side by side up front; their captured output is
+    # printed in the usual order, while the rest run live on this thread
+    output = ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {test_name: executor.submit(output.capture, test_func)
+                       for test_name, test_func in tests
+                       if test_name in PARALLEL_TESTS and test_name not in skipped_tests}
+    finally:
+        sys.stdout = output.stream
+    
     for test_name, test_func in tests:
         print(f"\n{test_name}:")
-        if test_func():
+        if test_name in skipped_tests:
+            print(f"  SKIPPED: Backend is {health}")
+            skipped += 1
+            continue
+        
+        if test_name in futures:
+            result, text = futures[test_name].result()
+            print(text, end="")
+        else:
+            result = test_func()
+        
+        if result:
             passed += 1
         else:
             print(f"  FAILED")
+        sys.stdout.flush()
     
     print("\n" + "=" * 60)
-    print(f"Validation Results: {passed}/{total} tests passed")
+    print(f"Validation Results: {passed}/{total - skipped} tests passed, {skipped} skipped")
     
-    if passed == total:
+    if skipped and passed == total - skipped:
+        print("All tests that ran passed, but skipped tests leave the milestone unverified; rerun with a healthy backend.")
+        return False
+    elif passed == total:
         print("All acceptance criteria met! Milestone 4 is complete.")
         return True
     else:
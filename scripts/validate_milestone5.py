@@ -3,25 +3,84 @@
 Validation script for Milestone 5: LLM Orchestration for Information Queries
 Tests LLM service with guardrails, deterministic outputs, and factual alignment.
 """
+import functools
 import sys
 import os
 import json
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from src.services.llm_service import LLMService, PromptLibrary
 from src.api.orchestrator import BackendOrchestrator
 from src.api.models import ProductInfoResponse
+# Shared helper next to this script, whether run directly or imported as scripts.*
+if __package__:
+    from ._output import ThreadOutput
+else:
+    from _output import ThreadOutput
+
+# Words that would leak store locations into an information answer
+LOCATION_WORDS = ("aisle", "section", "shelf", "bay", "where", "located", "find", "near", "next to", "beside")
+LOCATION_PATTERN = re.compile("|".join(map(re.escape, LOCATION_WORDS)))
+
+# Factual alignment eval set: every template asked about every product
+EVAL_PRODUCTS = ("milk", "bread", "cheese", "yogurt", "cereal", "pasta", "rice", "chicken", "beef", "fish")
+EVAL_TEMPLATES = (
+    ("what are the ingredients in {product}", "ingredients"),
+    ("how many calories in {product}", "nutrition"),
+    ("what is the price of {product}", "price"),
+    ("is {product} gluten free", "dietary"),
+    ("tell me about {product}", "general"),
+)
+
+# Words an answer of each question type is expected to mention; general answers only need content
+EXPECTED_KEYWORDS = {
+    "ingredients": ("ingredient", "contain", "made"),
+    "nutrition": ("calorie", "nutrition", "serving", "protein", "fat"),
+    "price": ("price", "cost", "check"),
+    "dietary": ("gluten", "dietary", "label", "check"),
+    "general": (),
+}
+
+@functools.lru_cache(maxsize=1)
+def get_service() -> LLMService:
+    """Return the LLMService shared by the tests."""
+    return LLMService()
+
+@functools.lru_cache(maxsize=1)
+def get_library() -> PromptLibrary:
+    """Return the PromptLibrary shared by the tests."""
+    return PromptLibrary()
+
+@functools.lru_cache(maxsize=1)
+def get_orchestrator() -> BackendOrchestrator:
+    """Return the BackendOrchestrator used by the integration test."""
+    return BackendOrchestrator()
+
+# Fields every information answer must carry
+INFO_KEYS = frozenset({"normalized_product", "answer", "confidence"})
+
+# Ask only a stratified tenth of the factual alignment eval set (--quick or VALIDATE_QUICK=1)
+QUICK = os.environ.get("VALIDATE_QUICK") == "1"
+
+# Tests that share no state beyond the cached services and can run concurrently
+PARALLEL_TESTS = frozenset({"JSON Validity", "Prompt Library"})
+
+# Tests that issue many real LLM calls and are skipped when the LLM is not healthy
+LLM_TESTS = frozenset({"Factual Alignment", "Performance", "Integration"})
 
 def test_llm_service_functionality():
     """Test LLM service basic functionality."""
     print("Testing LLM Service Functionality...")
     
-    service = LLMService()
+    service = get_service()
     
     # Test various question types
     test_cases = [
@@ -49,10 +108,8 @@ def test_llm_service_functionality():
             assert 0.0 <= response.confidence <= 1.0, f"Confidence should be 0-1, got {response.confidence}"
             
             # Check for location leakage
-            answer_lower = response.answer.lower()
-            location_words = ["aisle", "section", "shelf", "bay", "where", "located", "find", "near"]
-            for word in location_words:
-                assert word not in answer_lower, f"Location word '{word}' found in answer: {response.answer}"
+            leak = LOCATION_PATTERN.search(response.answer.lower())
+            assert leak is None, f"Location word '{leak.group(0)}' found in answer: {response.answer}"
             
             print(f"    PASSED: {expected_type} question handled correctly")
             passed += 1
@@ -69,7 +126,7 @@ def test_no_location_leakage():
     """Test that LLM responses never contain location information."""
     print("\nTesting No Location Leakage...")
     
-    service = LLMService()
+    service = get_service()
     
     # Test various question types that might trigger location responses
     test_questions = [
@@ -85,20 +142,17 @@ def test_no_location_leakage():
         "does this contain allergens"
     ]
     
-    location_words = ["aisle", "section", "shelf", "bay", "where", "located", "find", "near", "next to", "beside"]
     violations = 0
     total_tests = len(test_questions)
     
     for question in test_questions:
         try:
             response = service.generate_info_answer("test product", question)
-            answer_lower = response.answer.lower()
+            leak = LOCATION_PATTERN.search(response.answer.lower())
             
-            for word in location_words:
-                if word in answer_lower:
-                    print(f"    VIOLATION: Location word '{word}' found in answer for '{question}': {response.answer}")
-                    violations += 1
-                    break
+            if leak:
+                print(f"    VIOLATION: Location word '{leak.group(0)}' found in answer for '{question}': {response.answer}")
+                violations += 1
         except Exception as e:
             print(f"    ERROR: Failed to test question '{question}': {e}")
             violations += 1
@@ -117,7 +171,7 @@ def test_json_validity():
     """Test that LLM responses are valid JSON."""
     print("\nTesting JSON Validity...")
     
-    service = LLMService()
+    service = get_service()
     
     test_cases = [
         ("milk", "what are the ingredients in milk"),
@@ -134,17 +188,12 @@ def test_json_validity():
         try:
             response = service.generate_info_answer(product, question)
             
-            # Test that response can be converted to dict (JSON serializable)
-            response_dict = response.dict()
-            
-            # Test JSON serialization
-            json_str = json.dumps(response_dict)
-            parsed = json.loads(json_str)
+            # Test JSON serialization straight from the model, without an intermediate dict
+            parsed = json.loads(response.model_dump_json())
             
             # Validate required fields
-            assert "normalized_product" in parsed
-            assert "answer" in parsed
-            assert "confidence" in parsed
+            missing = INFO_KEYS - parsed.keys()
+            assert not missing, f"Missing fields {sorted(missing)}"
             
             print(f"    PASSED: JSON validity for '{question}'")
             passed += 1
@@ -161,7 +210,7 @@ def test_prompt_library():
     """Test prompt library functionality."""
     print("\nTesting Prompt Library...")
     
-    library = PromptLibrary()
+    library = get_library()
     
     # Test prompt template selection
     test_cases = [
@@ -185,8 +234,9 @@ def test_prompt_library():
             assert "{product}" in template, "Template should contain {product} placeholder"
             assert "{question}" in template, "Template should contain {question} placeholder"
             assert "{context}" in template, "Template should contain {context} placeholder"
-            assert "never provide location" in template.lower(), "Template should contain location guardrail"
-            assert "json" in template.lower(), "Template should mention JSON output"
+            template_lower = template.lower()
+            assert "never provide location" in template_lower, "Template should contain location guardrail"
+            assert "json" in template_lower, "Template should mention JSON output"
             
             print(f"    PASSED: {expected_type} template generated correctly")
             passed += 1
@@ -203,59 +253,41 @@ def test_factual_alignment():
     """Test factual alignment on eval set."""
     print("\nTesting Factual Alignment...")
     
-    service = LLMService()
+    service = get_service()
     
     # Create eval set of 50 questions
-    eval_questions = []
-    
-    # Ingredients questions (10)
-    for product in ["milk", "bread", "cheese", "yogurt", "cereal", "pasta", "rice", "chicken", "beef", "fish"]:
-        eval_questions.append((product, f"what are the ingredients in {product}", "ingredients"))
-    
-    # Nutrition questions (10)
-    for product in ["milk", "bread", "cheese", "yogurt", "cereal", "pasta", "rice", "chicken", "beef", "fish"]:
-        eval_questions.append((product, f"how many calories in {product}", "nutrition"))
-    
-    # Price questions (10)
-    for product in ["milk", "bread", "cheese", "yogurt", "cereal", "pasta", "rice", "chicken", "beef", "fish"]:
-        eval_questions.append((product, f"what is the price of {product}", "price"))
-    
-    # Dietary questions (10)
-    for product in ["milk", "bread", "cheese", "yogurt", "cereal", "pasta", "rice", "chicken", "beef", "fish"]:
-        eval_questions.append((product, f"is {product} gluten free", "dietary"))
-    
-    # General questions (10)
-    for product in ["milk", "bread", "cheese", "yogurt", "cereal", "pasta", "rice", "chicken", "beef", "fish"]:
-        eval_questions.append((product, f"tell me about {product}", "general"))
+    eval_questions = [(product, template.format(product=product), question_type)
+                      for template, question_type in EVAL_TEMPLATES
+                      for product in EVAL_PRODUCTS]
     
     assert len(eval_questions) == 50, f"Expected 50 eval questions, got {len(eval_questions)}"
     
+    if QUICK:
+        # Every fifth question keeps two products from each question type
+        eval_questions = eval_questions[::5]
+        print("  QUICK MODE: asking 10 of the 50 eval questions")
+    
     # Test factual alignment
     passed = 0
     total = len(eval_questions)
     
-    for product, question, expected_type in eval_questions:
+    # Ask every question up front; the service sends them concurrently
+    responses = service.generate_info_answer_batch([(product, question) for product, question, _ in eval_questions])
+    
+    for (product, question, expected_type), response in zip(eval_questions, responses):
         try:
-            response = service.generate_info_answer(product, question)
-            
             # Check that response is appropriate for question type
             answer_lower = response.answer.lower()
             
-            if expected_type == "ingredients":
-                assert any(word in answer_lower for word in ["ingredient", "contain", "made"]), f"Answer should mention ingredients: {response.answer}"
-            elif expected_type == "nutrition":
-                assert any(word in answer_lower for word in ["calorie", "nutrition", "serving", "protein", "fat"]), f"Answer should mention nutrition: {response.answer}"
-            elif expected_type == "price":
-                assert any(word in answer_lower for word in ["price", "cost", "check"]), f"Answer should mention price: {response.answer}"
-            elif expected_type == "dietary":
-                assert any(word in answer_lower for word in ["gluten", "dietary", "label", "check"]), f"Answer should mention dietary info: {response.answer}"
-            elif expected_type == "general":
+            keywords = EXPECTED_KEYWORDS[expected_type]
+            if keywords:
+                assert any(word in answer_lower for word in keywords), f"Answer should mention {expected_type}: {response.answer}"
+            else:
                 assert len(response.answer) > 0, "Answer should not be empty"
             
             # Check for location leakage
-            location_words = ["aisle", "section", "shelf", "bay", "where", "located", "find", "near"]
-            for word in location_words:
-                assert word not in answer_lower, f"Location word '{word}' found in answer: {response.answer}"
+            leak = LOCATION_PATTERN.search(answer_lower)
+            assert leak is None, f"Location word '{leak.group(0)}' found in answer: {response.answer}"
             
             passed += 1
             
@@ -276,7 +308,7 @@ def test_performance():
     """Test LLM service performance."""
     print("\nTesting Performance...")
     
-    service = LLMService()
+    service = get_service()
     
     # Test multiple queries for performance
     test_questions = [
@@ -290,20 +322,29 @@ def test_performance():
     total_time = 0
     successful_queries = 0
     
-    for product, question in test_questions:
-        start_time = time.time()
+    def timed_answer(pair):
+        start_time = time.perf_counter()
         try:
-            response = service.generate_info_answer(product, question)
-            end_time = time.time()
-            
-            latency = (end_time - start_time) * 1000  # Convert to milliseconds
-            total_time += latency
-            successful_queries += 1
-            
-            print(f"    Query '{question[:30]}...': {latency:.1f}ms")
-            
+            service.generate_info_answer(*pair)
+            error = None
         except Exception as e:
-            print(f"    Query '{question[:30]}...': FAILED - {e}")
+            error = e
+        return start_time, time.perf_counter(), error
+    
+    # One question at a time: a single Ollama instance serves requests in
+    # turn, so concurrent questions would count queue time against the threshold
+    timings = [timed_answer(pair) for pair in test_questions]
+    
+    for (_, question), (start_time, end_time, error) in zip(test_questions, timings):
+        if error is not None:
+            print(f"    Query '{question[:30]}...': FAILED - {error}")
+            continue
+        
+        latency = (end_time - start_time) * 1000  # Convert to milliseconds
+        total_time += latency
+        successful_queries += 1
+        
+        print(f"    Query '{question[:30]}...': {latency:.1f}ms")
     
     if successful_queries > 0:
         avg_latency = total_time / successful_queries
@@ -332,22 +373,18 @@ def test_integration():
     print("\nTesting Integration...")
     
     try:
-        orchestrator = BackendOrchestrator()
+        orchestrator = get_orchestrator()
         
         # Test information query
         response = orchestrator.process_text_query("what are the ingredients in bread")
         
         assert response.get("query_type") == "information"
-        assert "answer" in response
-        assert "confidence" in response
-        assert "normalized_product" in response
+        missing = INFO_KEYS - response.keys()
+        assert not missing, f"Missing fields {sorted(missing)}"
         
         # Check that answer doesn't contain location information
-        answer = response.get("answer", "").lower()
-        location_words = ["aisle", "section", "shelf", "bay", "where", "located", "find", "near"]
-        
-        for word in location_words:
-            assert word not in answer, f"Location word '{word}' found in answer: {response.get('answer')}"
+        leak = LOCATION_PATTERN.search(response.get("answer", "").lower())
+        assert leak is None, f"Location word '{leak.group(0)}' found in answer: {response.get('answer')}"
         
         print("    PASSED: Integration with orchestrator working correctly")
         return True
@@ -358,6 +395,16 @@ def test_integration():
 
 def main():
     """Run all validation tests."""
+    import argparse
+    
+    global QUICK
+    parser = argparse.ArgumentParser(description="Milestone 5 validation")
+    parser.add_argument("--quick", action="store_true", help="Sample 10 of the 50 factual alignment questions")
+    QUICK = parser.parse_args().quick or QUICK
+    
+    # Buffer output and flush once per test instead of on every line
+    sys.stdout.reconfigure(line_buffering=False)
+    
     print("Milestone 5 Validation: LLM Orchestration for Information Queries")
     print("=" * 70)
     
@@ -371,20 +418,55 @@ def main():
         ("Integration", test_integration)
     ]
     
+    # Tests that need a live LLM cannot succeed against a degraded backend,
+    # so skip them up front rather than waiting on calls that will time out
+    health = get_service().get_health_status().get("status", "unhealthy")
+    skipped_tests = set() if health == "healthy" else LLM_TESTS
+    if skipped_tests:
+        print(f"\nLLM service is {health}; skipping: {', '.join(name for name, _ in tests if name in skipped_tests)}")
+    
     passed = 0
+    skipped = 0
     total = len(tests)
     
+    # Independent tests run side by side up front; their captured output is
+    # printed in the usual order, while the rest run live on this thread
+    output = ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {test_name: executor.submit(output.capture, test_func)
+                       for test_name, test_func in tests
+                       if test_name in PARALLEL_TESTS and test_name not in skipped_tests}
+    finally:
+        sys.stdout = output.stream
+    
     for test_name, test_func in tests:
         print(f"\n{test_name}:")
-        if test_func():
+        if test_name in skipped_tests:
+            print(f"  SKIPPED: LLM service is {health}")
+            skipped += 1
+            continue
+        
+        if test_name in futures:
+            result, text = futures[test_name].result()
+            print(text, end="")
+        else:
+            result = test_func()
+        
+        if result:
             passed += 1
         else:
             print(f"  FAILED")
+        sys.stdout.flush()
     
     print("\n" + "=" * 70)
-    print(f"Validation Results: {passed}/{total} tests passed")
+    print(f"Validation Results: {passed}/{total - skipped} tests passed, {skipped} skipped")
     
-    if passed == total:
+    if skipped and passed == total - skipped:
+        print("All tests that ran passed, but skipped tests leave the milestone unverified; rerun with a healthy backend.")
+        return False
+    elif passed == total:
         print("All acceptance criteria met! Milestone 5 is complete.")
         return True
     else:
@@ -2,10 +2,13 @@
 Keyword router and normalization for query classification.
 Implements lightweight keyword-and-pattern classifier with confidence scoring.
 """
+import functools
 import re
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
 from .keywords import KeywordDictionary
 from .product_extractor import ProductExtractor, ProductCandidate
 
@@ -33,17 +36,28 @@ class QueryRouter:
         self.information_threshold = 0.3
         self.disambiguation_threshold = 0.7
         self.confidence_threshold = 0.6
+        
+        # Results for repeated queries; per instance so the cache never
+        # outlives the router or mixes results from different databases
+        self._classify_cached = functools.lru_cache(maxsize=1024)(self._classify_internal)
     
     def classify_query(self, text: str) -> ClassificationResult:
         """
         Classify a query as location or information intent.
         
+        Repeated queries are answered from a per-router cache, so callers
+        should treat the returned result as read-only.
+        
         Args:
             text: Input query text
             
         Returns:
             ClassificationResult with route, confidence, and product info
         """
+        return self._classify_cached(text)
+    
+    def _classify_internal(self, text: str) -> ClassificationResult:
+        """Classify a query without consulting the cache."""
         if not text or not text.strip():
             return ClassificationResult(
                 route="information",
@@ -226,25 +240,22 @@ class QueryRouter:
     
     def batch_classify(self, queries: List[str]) -> List[ClassificationResult]:
         """Classify multiple queries in batch."""
-        results = []
-        for query in queries:
-            result = self.classify_query(query)
-            results.append(result)
-        return results
+        # Product extraction reads the synonym and product tables once into
+        # memory, so a batch costs no more database round trips than one query
+        return [self.classify_query(query) for query in queries]
     
-    def get_confidence_distribution(self, queries: List[str]) -> Dict[str, List[float]]:
-        """Get confidence score distribution for queries."""
+    def get_confidence_distribution(self, queries: List[str]) -> Dict[str, np.ndarray]:
+        """Get confidence score distribution for queries as float32 arrays per route."""
         location_confidences = []
         information_confidences = []
         
-        for query in queries:
-            result = self.classify_query(query)
+        for result in self.batch_classify(queries):
             if result.route == "location":
                 location_confidences.append(result.confidence)
             else:
                 information_confidences.append(result.confidence)
         
         return {
-            "location": location_confidences,
-            "information": information_confidences
+            "location": np.asarray(location_confidences, dtype=np.float32),
+            "information": np.asarray(information_confidences, dtype=np.float32)
         }
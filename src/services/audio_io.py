@@ -3,7 +3,8 @@ Audio I/O service for voice input/output with STT and TTS capabilities.
 This is now a compatibility layer that uses Google services internally.
 """
 import logging
-from typing import Optional, Callable, Dict, Any
+import os
+from typing import Optional, Callable, Dict, Any, List
 import numpy as np
 
 from config.settings import AUDIO_CONFIG
@@ -26,15 +27,16 @@ class AudioIOService:
         self.barge_in_detected = False
         
     def record(self, duration: Optional[float] = None, 
-               callback: Optional[Callable] = None) -> np.ndarray:
-        """Record audio from microphone."""
+               callback: Optional[Callable] = None,
+               out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Record audio from microphone, optionally into a preallocated float32 buffer."""
         self.is_recording = True
         try:
             # Google service doesn't support VAD-based recording, so use fixed duration
             if duration is None:
                 duration = self.config.get("max_recording_duration", 10.0)
             
-            audio_data = self.google_service.record(duration)
+            audio_data = self.google_service.record(duration, out=out)
             return audio_data
         finally:
             self.is_recording = False
@@ -43,26 +45,34 @@ class AudioIOService:
         """Transcribe audio to text using Google STT."""
         return self.google_service.transcribe(audio_data)
     
+    def transcribe_batch(self, clips: List[np.ndarray]) -> List[str]:
+        """Transcribe several clips at once using Google STT."""
+        return self.google_service.transcribe_batch(clips)
+    
     def synthesize(self, text: str) -> np.ndarray:
-        """Synthesize text to speech using Google TTS."""
-        # Google service returns bytes, but this method expects np.ndarray
-        # For compatibility, we'll return an empty array and handle this in play()
-        self._last_synthesized_text = text  # Store for play method
-        return np.array([])
+        """Synthesize text to speech using Google TTS.
+        
+        Returns the encoded MP3 stream as a uint8 array (a view of the
+        bytes, not a copy), or an empty array if synthesis failed.
+        """
+        audio_bytes, temp_file_path = self.google_service.synthesize(text)
+        if temp_file_path:
+            try:
+                os.unlink(temp_file_path)
+            except OSError:
+                pass
+        return np.frombuffer(audio_bytes, dtype=np.uint8)
     
     def play(self, audio_data: np.ndarray, 
              interrupt_callback: Optional[Callable] = None) -> bool:
         """Play audio data through speakers."""
         self.is_playing = True
         try:
-            # If audio_data is empty, use the last synthesized text
-            if len(audio_data) == 0 and hasattr(self, '_last_synthesized_text'):
-                audio_bytes = self.google_service.synthesize(self._last_synthesized_text)
-                self.google_service.play(audio_bytes)
+            # Encoded audio from synthesize() is handed straight to the player
+            if audio_data.dtype == np.uint8 and len(audio_data) > 0:
+                self.google_service.play(audio_data.tobytes())
                 return True
             else:
-                # This is a simplified approach - in a real implementation,
-                # you'd need to convert np.ndarray to bytes properly
                 logger.warning("Direct playback of numpy arrays not fully supported")
                 return False
         finally:
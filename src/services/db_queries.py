@@ -88,28 +88,57 @@ class DatabaseService:
         cursor = conn.cursor()
         
         try:
-            # Try exact match first
-            exact_matches = self._find_exact_matches(cursor, normalized_query, limit)
-            if exact_matches:
-                return exact_matches
-            
-            # Try fuzzy matching
-            fuzzy_matches = self._find_fuzzy_matches(cursor, normalized_query, limit)
-            if fuzzy_matches:
-                return fuzzy_matches
-            
-            # Try synonym matching
-            synonym_matches = self._find_synonym_matches(cursor, normalized_query, limit)
-            if synonym_matches:
-                return synonym_matches
-            
-            # Try partial matching
-            partial_matches = self._find_partial_matches(cursor, normalized_query, limit)
-            return partial_matches
+            return self._find_locations(cursor, normalized_query, limit)
+        finally:
+            conn.close()
+    
+    def find_product_locations_batch(self, queries: List[str], limit: int = 10) -> Dict[str, List[ProductMatch]]:
+        """
+        Find product locations for several queries over one connection.
+        
+        Args:
+            queries: Search queries
+            limit: Maximum number of results per query
             
+        Returns:
+            Dict mapping each query to its list of ProductMatch objects
+        """
+        results = {query: [] for query in queries}
+        normalized = {query: self.normalize_product_name(query) for query in queries if query}
+        if not any(normalized.values()):
+            return results
+        
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            for query, normalized_query in normalized.items():
+                if normalized_query:
+                    results[query] = self._find_locations(cursor, normalized_query, limit)
+            return results
         finally:
             conn.close()
     
+    def _find_locations(self, cursor, normalized_query: str, limit: int) -> List[ProductMatch]:
+        """Run the exact, fuzzy, synonym and partial lookups in turn, stopping at the first hit."""
+        # Try exact match first
+        exact_matches = self._find_exact_matches(cursor, normalized_query, limit)
+        if exact_matches:
+            return exact_matches
+        
+        # Try fuzzy matching
+        fuzzy_matches = self._find_fuzzy_matches(cursor, normalized_query, limit)
+        if fuzzy_matches:
+            return fuzzy_matches
+        
+        # Try synonym matching
+        synonym_matches = self._find_synonym_matches(cursor, normalized_query, limit)
+        if synonym_matches:
+            return synonym_matches
+        
+        # Try partial matching
+        return self._find_partial_matches(cursor, normalized_query, limit)
+    
     def _find_exact_matches(self, cursor, query: str, limit: int) -> List[ProductMatch]:
         """Find exact matches for product names."""
         cursor.execute("""
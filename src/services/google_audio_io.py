@@ -4,12 +4,15 @@ Google-based Audio I/O Service using Google TTS and Google STT.
 This provides much better quality than the local alternatives.
 """
 
+import atexit
+import functools
 import logging
 import tempfile
 import os
 import io
 import numpy as np
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
 from gtts import gTTS
 import speech_recognition as sr
 import pyaudio
@@ -17,21 +20,33 @@ import wave
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=1)
+def _pyaudio() -> pyaudio.PyAudio:
+    """Process-wide PyAudio handle; PortAudio is initialized once and terminated at exit."""
+    instance = pyaudio.PyAudio()
+    atexit.register(instance.terminate)
+    return instance
+
+@functools.lru_cache(maxsize=1)
+def _microphone() -> sr.Microphone:
+    """Process-wide default microphone; creating one probes the audio devices."""
+    return sr.Microphone()
+
 class GoogleAudioIOService:
     """Audio I/O service using Google TTS and Google STT for better quality."""
     
     def __init__(self):
         """Initialize the Google Audio I/O service."""
         self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
+        self.microphone = _microphone()
         
         # Audio parameters
         self.sample_rate = 16000
         self.chunk_size = 1024
         self.channels = 1
         
-        # Initialize PyAudio for recording
-        self.pyaudio_instance = pyaudio.PyAudio()
+        # Shared PyAudio handle for recording
+        self.pyaudio_instance = _pyaudio()
         
         logger.info("Google Audio I/O service initialized")
     
@@ -58,8 +73,18 @@ class GoogleAudioIOService:
                 'error': str(e)
             }
     
-    def record(self, duration: float = 3.0) -> Optional[np.ndarray]:
-        """Record audio from microphone using PyAudio."""
+    def record(self, duration: float = 3.0,
+               out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """Record audio from microphone using PyAudio.
+        
+        If out is given, samples are written into it and a view of the
+        recorded portion is returned instead of a new array.
+        """
+        num_chunks = int(self.sample_rate * duration / self.chunk_size)
+        num_samples = num_chunks * self.chunk_size
+        if out is not None and (out.dtype != np.float32 or len(out) < num_samples):
+            raise ValueError(f"out must be a float32 array of at least {num_samples} samples")
+        
         try:
             logger.info(f"Recording for {duration} seconds...")
             
@@ -72,24 +97,20 @@ class GoogleAudioIOService:
                 frames_per_buffer=self.chunk_size
             )
             
-            frames = []
-            num_chunks = int(self.sample_rate * duration / self.chunk_size)
+            audio_float = np.empty(num_samples, dtype=np.float32) if out is None else out[:num_samples]
             
-            for _ in range(num_chunks):
+            # Convert each chunk to normalized float32 straight into its slot
+            for i in range(num_chunks):
                 data = stream.read(self.chunk_size)
-                frames.append(data)
+                chunk = np.frombuffer(data, dtype=np.int16)
+                np.multiply(chunk, 1 / 32768.0,
+                            out=audio_float[i * self.chunk_size:(i + 1) * self.chunk_size],
+                            casting='same_kind')
             
             # Stop and close stream
             stream.stop_stream()
             stream.close()
             
-            # Convert to numpy array
-            audio_data = b''.join(frames)
-            audio_array = np.frombuffer(audio_data, dtype=np.int16)
-            
-            # Convert to float32 and normalize
-            audio_float = audio_array.astype(np.float32) / 32768.0
-            
             logger.info(f"Recording completed: {len(audio_float)} samples")
             return audio_float
             
@@ -129,6 +150,13 @@ class GoogleAudioIOService:
             logger.error(f"Transcription failed: {e}")
             return ""
     
+    def transcribe_batch(self, clips: List[np.ndarray]) -> List[str]:
+        """Transcribe several clips, sending their STT requests concurrently."""
+        if not clips:
+            return []
+        with ThreadPoolExecutor(max_workers=len(clips)) as executor:
+            return list(executor.map(self.transcribe, clips))
+    
     def synthesize(self, text: str, language: str = 'en') -> tuple:
         """Synthesize text to speech using Google TTS.
         
@@ -191,8 +219,7 @@ class GoogleAudioIOService:
     def cleanup(self):
         """Clean up audio resources."""
         try:
-            if hasattr(self, 'pyaudio_instance'):
-                self.pyaudio_instance.terminate()
+            # The PyAudio handle is shared by all instances and terminated at exit
             logger.info("Google Audio I/O service cleaned up")
         except Exception as e:
             logger.error(f"Cleanup failed: {e}")
@@ -5,7 +5,8 @@ Integrates with open-source LLM (Mistral via Ollama) with guardrails and determi
 import json
 import logging
 import requests
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 
 from ..api.models import ProductInfoResponse
@@ -36,6 +37,12 @@ class LLMService:
         # Initialize prompt library
         self.prompt_library = PromptLibrary()
         
+        # Pooled HTTP session, so repeated Ollama calls reuse keep-alive connections
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=8)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
     def generate_info_answer(self, product: str, question: str, db_attributes: Dict[str, Any] = None) -> ProductInfoResponse:
         """
         Generate information answer for a product question.
@@ -80,6 +87,23 @@ class LLMService:
             logger.error(f"Full traceback: {traceback.format_exc()}")
             return self._create_fallback_response(product, question)
     
+    def generate_info_answer_batch(self, questions: List[Tuple[str, str]]) -> List[ProductInfoResponse]:
+        """
+        Generate answers for several (product, question) pairs concurrently.
+        
+        Args:
+            questions: List of (product, question) tuples
+            
+        Returns:
+            ProductInfoResponse for each pair, in input order
+        """
+        if not questions:
+            return []
+        
+        # Bounded by the session's connection pool so requests never wait on a socket
+        with ThreadPoolExecutor(max_workers=min(8, len(questions))) as executor:
+            return list(executor.map(lambda pair: self.generate_info_answer(*pair), questions))
+    
     def _build_context(self, product: str, db_attributes: Dict[str, Any] = None) -> str:
         """Build context from database attributes."""
         if not db_attributes or not isinstance(db_attributes, dict):
@@ -113,7 +137,7 @@ class LLMService:
         """Call the LLM service via Ollama."""
         try:
             # Call Ollama API
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": self.model_name,
@@ -294,7 +318,7 @@ class LLMService:
         """Get health status of LLM service."""
         try:
             # Test Ollama connectivity
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             if response.status_code == 200:
                 models = response.json().get("models", [])
                 model_available = any(model.get("name", "").startswith(self.model_name) for model in models)
@@ -727,7 +751,7 @@ class LLMService:
                 "image": (filename, image_bytes, "image/jpeg")
             }
 
-            resp = requests.post(url, files=files, headers=headers, timeout=VLM_CONFIG.get("timeout", 30))
+            resp = self.session.post(url, files=files, headers=headers, timeout=VLM_CONFIG.get("timeout", 30))
             if resp.status_code != 200:
                 logger.error(f"VLM API error: {resp.status_code} - {resp.text}")
                 raise Exception(f"VLM API error: {resp.status_code}")
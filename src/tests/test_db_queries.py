@@ -219,6 +219,16 @@ class TestDatabaseQueries:
             matches = db_service.find_product_locations(query, limit=limit)
             assert len(matches) <= limit, f"Should return at most {limit} matches"
     
+    def test_find_product_locations_batch(self, db_service):
+        """Test that batch lookup matches per-query lookup."""
+        queries = ["milk", "apple", "", "xyz123nonexistent"]
+        
+        results = db_service.find_product_locations_batch(queries, limit=3)
+        
+        assert list(results) == queries, "Should return an entry for every query"
+        for query in queries:
+            assert results[query] == db_service.find_product_locations(query, limit=3)
+    
     def test_empty_query(self, db_service):
         """Test behavior with empty queries."""
         empty_queries = ["", "   ", None]
@@ -172,6 +172,23 @@ class TestLLMService:
             assert response.confidence < 0.5
             assert response.caveats is not None
     
+    def test_generate_info_answer_batch(self):
+        """Test batch answers come back in input order."""
+        service = LLMService()
+        questions = [
+            ("milk", "what are the ingredients in milk"),
+            ("bread", "how many calories in bread"),
+            ("cheese", "is cheese gluten free"),
+        ]
+        
+        responses = service.generate_info_answer_batch(questions)
+        
+        assert len(responses) == len(questions)
+        for (product, _), response in zip(questions, responses):
+            assert isinstance(response, ProductInfoResponse)
+            assert response.normalized_product == product
+        assert service.generate_info_answer_batch([]) == []
+    
     def test_health_status(self):
         """Test health status check."""
         service = LLMService()
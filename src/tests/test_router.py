@@ -358,6 +358,16 @@ class TestQueryRouter:
         assert len(results) == len(queries), "Should return same number of results as queries"
         assert all(isinstance(r, ClassificationResult) for r in results), "All results should be ClassificationResult objects"
     
+    def test_repeated_query_is_cached(self, temp_db):
+        """Test that repeating a query returns the cached result."""
+        router = QueryRouter(temp_db)
+        
+        first = router.classify_query("where is the milk")
+        second = router.classify_query("where is the milk")
+        
+        assert second is first, "Repeated query should be served from the cache"
+        assert router.classify_query("find apples") is not first, "Different queries should not share a result"
+    
     def test_classification_stats(self, temp_db):
         """Test classification statistics."""
         router = QueryRouter(temp_db)